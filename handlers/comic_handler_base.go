@@ -60,20 +60,22 @@ func ServeComicArchiveFromZIP(filePath string, page int) ([]byte, string, error)
 	defer r.Close()
 
 	// Get sorted list of image files
-	var imageFiles []string
+	var imageFiles []*zip.File
 	for _, f := range r.File {
 		if isImageFile(f.Name) {
-			imageFiles = append(imageFiles, f.Name)
+			imageFiles = append(imageFiles, f)
 		}
 	}
 
-	sort.Strings(imageFiles)
+	sort.Slice(imageFiles, func(i, j int) bool {
+		return imageFiles[i].Name < imageFiles[j].Name
+	})
 
 	if page < 1 || page > len(imageFiles) {
 		return nil, "", fmt.Errorf("page %d out of range", page)
 	}
 
-	file := r.File[page-1]
+	file := imageFiles[page-1]
 	rc, err := file.Open()
 	if err != nil {
 		return nil, "", err
@@ -81,7 +83,7 @@ func ServeComicArchiveFromZIP(filePath string, page int) ([]byte, string, error)
 	defer rc.Close()
 
 	// Serve raw image bytes without processing
-	data, err := io.ReadAll(rc)
+	data, err := readZipEntry(rc, file)
 	if err != nil {
 		return nil, "", err
 	}
@@ -1,10 +1,27 @@
 package handlers
 
 import (
+	"archive/zip"
+	"bytes"
+	"io"
 	"path/filepath"
 	"strings"
 )
 
+// maxZipPrealloc caps how much of an entry's declared size readZipEntry trusts up front.
+const maxZipPrealloc = 64 << 20
+
+// readZipEntry reads an opened zip entry into a buffer presized from its declared
+// uncompressed size, avoiding the repeated grow-and-copy of io.ReadAll.
+func readZipEntry(rc io.Reader, f *zip.File) ([]byte, error) {
+	var buf bytes.Buffer
+	buf.Grow(int(min(f.UncompressedSize64, maxZipPrealloc)) + bytes.MinRead)
+	if _, err := buf.ReadFrom(rc); err != nil {
+		return nil, err
+	}
+	return buf.Bytes(), nil
+}
+
 // isImageFile returns true if the filename has a recognized image extension.
 func isImageFile(name string) bool {
 	switch strings.ToLower(filepath.Ext(name)) {
@@ -249,31 +249,17 @@ func serveComicPage(c fiber.Ctx, chapter *models.Chapter, page int) error {
 		return serveImageFromDirectoryImageHandler(c, filePath, page)
 	}
 
-	lowerFileName := strings.ToLower(fileInfo.Name())
+	ext := strings.ToLower(filepath.Ext(fileInfo.Name()))
 
 	// Serve the file based on its extension
-	switch {
-	case strings.HasSuffix(lowerFileName, ".jpg"), strings.HasSuffix(lowerFileName, ".jpeg"),
-		strings.HasSuffix(lowerFileName, ".png"), strings.HasSuffix(lowerFileName, ".webp"),
-		strings.HasSuffix(lowerFileName, ".gif"):
+	switch ext {
+	case ".jpg", ".jpeg", ".png", ".webp", ".gif":
 		// Serve raw image bytes
-		switch strings.ToLower(filepath.Ext(filePath)) {
-		case ".jpg", ".jpeg":
-			c.Set("Content-Type", "image/jpeg")
-		case ".png":
-			c.Set("Content-Type", "image/png")
-		case ".gif":
-			c.Set("Content-Type", "image/gif")
-		case ".webp":
-			c.Set("Content-Type", "image/webp")
-		default:
-			c.Set("Content-Type", "application/octet-stream")
-		}
+		c.Set("Content-Type", getContentType(filePath))
 		c.Set("Cache-Control", "public, max-age=31536000, immutable")
-		ext := strings.ToLower(strings.TrimPrefix(filepath.Ext(filePath), "."))
-		imageLoadDuration.WithLabelValues(ext).Observe(time.Since(start).Seconds())
+		imageLoadDuration.WithLabelValues(ext[1:]).Observe(time.Since(start).Seconds())
 		return c.SendFile(filePath)
-	case strings.HasSuffix(lowerFileName, ".cbr"), strings.HasSuffix(lowerFileName, ".rar"):
+	case ".cbr", ".rar":
 		imageLoadDuration.WithLabelValues("cbr").Observe(time.Since(start).Seconds())
 		imageBytes, contentType, err := ServeComicArchiveFromRAR(filePath, page)
 		if err != nil {
@@ -281,7 +267,7 @@ func serveComicPage(c fiber.Ctx, chapter *models.Chapter, page int) error {
 		}
 		c.Set("Content-Type", contentType)
 		return c.Send(imageBytes)
-	case strings.HasSuffix(lowerFileName, ".cbz"), strings.HasSuffix(lowerFileName, ".zip"):
+	case ".cbz", ".zip":
 		imageLoadDuration.WithLabelValues("cbz").Observe(time.Since(start).Seconds())
 		imageBytes, contentType, err := ServeComicArchiveFromZIP(filePath, page)
 		if err != nil {
@@ -7,10 +7,12 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"sync"
 
 	"github.com/alexander-bruun/magi/models"
 	"github.com/alexander-bruun/magi/scheduler"
 	"github.com/alexander-bruun/magi/utils/files"
+	"github.com/alexander-bruun/magi/utils/store"
 	"github.com/alexander-bruun/magi/views"
 	fiber "github.com/gofiber/fiber/v3"
 	"github.com/gofiber/fiber/v3/log"
@@ -374,124 +376,138 @@ func HandleIndexPosters(c fiber.Ctx) error {
 
 	log.Debugf("Processing %d medias for poster re-indexing", len(medias))
 
-	// Candidate poster file names to look for
-	posterCandidates := []string{"poster.webp", "poster.jpg", "poster.jpeg", "poster.png", "thumbnail.webp", "thumbnail.jpg", "thumbnail.jpeg", "thumbnail.png", "cover.webp", "cover.jpg", "cover.jpeg", "cover.png"}
-
+	// Re-index posters with a small bounded pool; each media does disk and network I/O
+	const posterWorkers = 4
+	sem := make(chan struct{}, posterWorkers)
+	var wg sync.WaitGroup
 	for _, media := range medias {
-		log.Debugf("Processing poster for media '%s'", media.Slug)
+		wg.Add(1)
+		sem <- struct{}{}
+		go func() {
+			defer wg.Done()
+			defer func() { <-sem }()
+			reindexMediaPoster(media, dataBackend)
+		}()
+	}
+	wg.Wait()
 
-		chapters, err := models.GetChapters(media.Slug)
-		if err != nil || len(chapters) == 0 {
-			log.Debugf("Skipping media '%s': no chapters found", media.Slug)
-			continue
-		}
+	log.Infof("Completed poster re-indexing for library '%s'", library.Name)
 
-		lib, err := models.GetLibrary(chapters[0].LibrarySlug)
-		if err != nil {
-			log.Warnf("Failed to get library for media '%s': %v", media.Slug, err)
-			continue
-		}
+	return c.SendString(`<uk-icon icon="Image"></uk-icon>`)
+}
 
-		if len(lib.Folders) == 0 {
-			log.Debugf("Skipping media '%s': no folders in library", media.Slug)
-			continue
-		}
+// reindexMediaPoster refreshes one media's poster from a local poster file, its saved
+// potential poster URLs, or the first archive, in that order.
+func reindexMediaPoster(media models.Media, dataBackend *store.FileStore) {
+	log.Debugf("Processing poster for media '%s'", media.Slug)
 
-		path := filepath.Join(lib.Folders[0], chapters[0].File)
-		mediaDir := filepath.Dir(path)
+	chapters, err := models.GetChapters(media.Slug)
+	if err != nil || len(chapters) == 0 {
+		log.Debugf("Skipping media '%s': no chapters found", media.Slug)
+		return
+	}
 
-		log.Debugf("Checking for local posters in '%s' for media '%s'", mediaDir, media.Slug)
+	lib, err := models.GetLibrary(chapters[0].LibrarySlug)
+	if err != nil {
+		log.Warnf("Failed to get library for media '%s': %v", media.Slug, err)
+		return
+	}
 
-		var posterURL string
-		var usedLocal bool
-		var skipMedia bool
+	if len(lib.Folders) == 0 {
+		log.Debugf("Skipping media '%s': no folders in library", media.Slug)
+		return
+	}
 
-		// Check for local poster files
-		for _, candidate := range posterCandidates {
-			posterPath := filepath.Join(mediaDir, candidate)
-			if stat, err := os.Stat(posterPath); err == nil {
-				localSize := stat.Size()
+	path := filepath.Join(lib.Folders[0], chapters[0].File)
+	mediaDir := filepath.Dir(path)
 
-				// Get current poster size if exists
-				currentSize := int64(-1)
-				if currentData, err := dataBackend.Load("posters/" + media.Slug + ".webp"); err == nil {
-					currentSize = int64(len(currentData))
-				}
+	log.Debugf("Checking for local posters in '%s' for media '%s'", mediaDir, media.Slug)
 
-				// Use local poster if sizes differ or no current poster
-				if currentSize == -1 || localSize != currentSize {
-					log.Debugf("Using local poster '%s' for media '%s' (local size: %d, current size: %d)", posterPath, media.Slug, localSize, currentSize)
-					posterURL, err = files.ProcessLocalImageWithThumbnails(posterPath, media.Slug, dataBackend, true)
-					if err != nil {
-						log.Warnf("Failed to process local poster '%s' for media '%s': %v", posterPath, media.Slug, err)
-						continue
-					}
-					usedLocal = true
-					break
-				} else {
-					log.Debugf("Skipping media '%s': local poster '%s' has same size as current (%d)", media.Slug, posterPath, localSize)
-					skipMedia = true
-					break
-				}
-			}
-		}
+	var posterURL string
+	var usedLocal bool
+	var skipMedia bool
 
-		// Skip this media if local poster exists and size matches
-		if skipMedia {
-			continue
-		}
+	// Check for local poster files
+	for _, candidate := range scheduler.StandalonePosterFiles {
+		posterPath := filepath.Join(mediaDir, candidate)
+		if stat, err := os.Stat(posterPath); err == nil {
+			localSize := stat.Size()
 
-		// If no local poster was used, try downloading from potential poster URLs
-		if !usedLocal {
-			// Get media to check for potential poster URLs
-			m, err := models.GetMediaUnfiltered(media.Slug)
-			if err != nil {
-				log.Warnf("Failed to get media '%s': %v", media.Slug, err)
-			} else if len(m.PotentialPosterURLs) > 0 {
-				log.Debugf("Trying %d potential poster URLs for media '%s'", len(m.PotentialPosterURLs), media.Slug)
-				for _, url := range m.PotentialPosterURLs {
-					log.Debugf("Attempting to download poster from '%s' for media '%s'", url, media.Slug)
-					downloadedURL, err := files.DownloadPosterImage(url, media.Slug, dataBackend, true)
-					if err != nil {
-						log.Debugf("Failed to download poster from '%s' for media '%s': %v", url, media.Slug, err)
-						continue
-					}
-					posterURL = downloadedURL
-					usedLocal = true
-					log.Debugf("Downloaded poster from URL for media '%s'", media.Slug)
-					break
-				}
+			// Get current poster size if exists
+			currentSize := int64(-1)
+			if currentData, err := dataBackend.Load("posters/" + media.Slug + ".webp"); err == nil {
+				currentSize = int64(len(currentData))
 			}
-		}
 
-		// If no local poster or URL was used, extract from archive
-		if !usedLocal {
-			log.Debugf("Extracting poster from archive for media '%s'", media.Slug)
-			posterURL, err = files.ExtractPosterImage(path, media.Slug, dataBackend, true)
-			if err != nil {
-				log.Warnf("Failed to extract poster for media '%s': %v", media.Slug, err)
-				continue
+			// Use local poster if sizes differ or no current poster
+			if currentSize == -1 || localSize != currentSize {
+				log.Debugf("Using local poster '%s' for media '%s' (local size: %d, current size: %d)", posterPath, media.Slug, localSize, currentSize)
+				posterURL, err = files.ProcessLocalImageWithThumbnails(posterPath, media.Slug, dataBackend, true)
+				if err != nil {
+					log.Warnf("Failed to process local poster '%s' for media '%s': %v", posterPath, media.Slug, err)
+					continue
+				}
+				usedLocal = true
+				break
+			} else {
+				log.Debugf("Skipping media '%s': local poster '%s' has same size as current (%d)", media.Slug, posterPath, localSize)
+				skipMedia = true
+				break
 			}
 		}
+	}
+
+	// Skip this media if local poster exists and size matches
+	if skipMedia {
+		return
+	}
 
-		// Update media cover art
+	// If no local poster was used, try downloading from potential poster URLs
+	if !usedLocal {
+		// Get media to check for potential poster URLs
 		m, err := models.GetMediaUnfiltered(media.Slug)
 		if err != nil {
 			log.Warnf("Failed to get media '%s': %v", media.Slug, err)
-			continue
+		} else if len(m.PotentialPosterURLs) > 0 {
+			log.Debugf("Trying %d potential poster URLs for media '%s'", len(m.PotentialPosterURLs), media.Slug)
+			for _, url := range m.PotentialPosterURLs {
+				log.Debugf("Attempting to download poster from '%s' for media '%s'", url, media.Slug)
+				downloadedURL, err := files.DownloadPosterImage(url, media.Slug, dataBackend, true)
+				if err != nil {
+					log.Debugf("Failed to download poster from '%s' for media '%s': %v", url, media.Slug, err)
+					continue
+				}
+				posterURL = downloadedURL
+				usedLocal = true
+				log.Debugf("Downloaded poster from URL for media '%s'", media.Slug)
+				break
+			}
 		}
-		m.CoverArtURL = posterURL
-		err = models.UpdateMedia(m)
+	}
+
+	// If no local poster or URL was used, extract from archive
+	if !usedLocal {
+		log.Debugf("Extracting poster from archive for media '%s'", media.Slug)
+		posterURL, err = files.ExtractPosterImage(path, media.Slug, dataBackend, true)
 		if err != nil {
-			log.Warnf("Failed to update media '%s': %v", media.Slug, err)
-		} else {
-			log.Debugf("Updated poster for media '%s'", media.Slug)
+			log.Warnf("Failed to extract poster for media '%s': %v", media.Slug, err)
+			return
 		}
 	}
 
-	log.Infof("Completed poster re-indexing for library '%s'", library.Name)
-
-	return c.SendString(`<uk-icon icon="Image"></uk-icon>`)
+	// Update media cover art
+	m, err := models.GetMediaUnfiltered(media.Slug)
+	if err != nil {
+		log.Warnf("Failed to get media '%s': %v", media.Slug, err)
+		return
+	}
+	m.CoverArtURL = posterURL
+	err = models.UpdateMedia(m)
+	if err != nil {
+		log.Warnf("Failed to update media '%s': %v", media.Slug, err)
+	} else {
+		log.Debugf("Updated poster for media '%s'", media.Slug)
+	}
 }
 
 // HandleIndexMetadata re-indexes metadata for all media in the library
@@ -543,30 +559,46 @@ func HandleIndexChapters(c fiber.Ctx) error {
 		return SendInternalServerError(c, ErrInternalServerError, err)
 	}
 
+	// Re-index chapters with a small bounded pool, matching the indexer's media workers
+	const chapterWorkers = 4
+	sem := make(chan struct{}, chapterWorkers)
+	var wg sync.WaitGroup
 	for _, media := range medias {
-		chapters, err := models.GetChapters(media.Slug)
-		if err != nil || len(chapters) == 0 {
-			continue
-		}
+		wg.Add(1)
+		sem <- struct{}{}
+		go func() {
+			defer wg.Done()
+			defer func() { <-sem }()
+			reindexMediaChapters(media, slug)
+		}()
+	}
+	wg.Wait()
 
-		lib, err := models.GetLibrary(chapters[0].LibrarySlug)
-		if err != nil {
-			continue
-		}
+	return c.SendString(`<uk-icon icon="BookOpen"></uk-icon>`)
+}
 
-		if len(lib.Folders) == 0 {
-			continue
-		}
+// reindexMediaChapters re-indexes one media's chapters from the folder of its first chapter.
+func reindexMediaChapters(media models.Media, librarySlug string) {
+	chapters, err := models.GetChapters(media.Slug)
+	if err != nil || len(chapters) == 0 {
+		return
+	}
 
-		path := filepath.Dir(filepath.Join(lib.Folders[0], chapters[0].File))
+	lib, err := models.GetLibrary(chapters[0].LibrarySlug)
+	if err != nil {
+		return
+	}
 
-		_, _, _, _, err = scheduler.IndexChapters(media.Slug, path, slug, false)
-		if err != nil {
-			log.Warnf("Failed to index chapters for media '%s': %v", media.Slug, err)
-		}
+	if len(lib.Folders) == 0 {
+		return
 	}
 
-	return c.SendString(`<uk-icon icon="BookOpen"></uk-icon>`)
+	path := filepath.Dir(filepath.Join(lib.Folders[0], chapters[0].File))
+
+	_, _, _, _, err = scheduler.IndexChapters(media.Slug, path, librarySlug, false)
+	if err != nil {
+		log.Warnf("Failed to index chapters for media '%s': %v", media.Slug, err)
+	}
 }
 
 // HandleRecalculateRecommendations triggers recomputation of recommendations for all media in the library
@@ -255,7 +255,13 @@ func HandleMedia(c fiber.Ctx) error {
 // checkMediaAccess checks if the user has access to the media based on library permissions
 func checkMediaAccess(c fiber.Ctx, chapters []models.Chapter) error {
 	hasAccess := len(chapters) == 0 // If no chapters, allow access (media might be empty or public)
+	// Chapters usually share a handful of libraries, so only check each library once
+	checked := make(map[string]struct{})
 	for _, chapter := range chapters {
+		if _, ok := checked[chapter.LibrarySlug]; ok {
+			continue
+		}
+		checked[chapter.LibrarySlug] = struct{}{}
 		access, err := UserHasLibraryAccess(c, chapter.LibrarySlug)
 		if err != nil {
 			return SendInternalServerError(c, ErrInternalServerError, err)
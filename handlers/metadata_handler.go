@@ -5,6 +5,7 @@ import (
 	"path/filepath"
 	"sort"
 	"strings"
+	"sync"
 
 	"github.com/alexander-bruun/magi/metadata"
 	"github.com/alexander-bruun/magi/models"
@@ -14,6 +15,42 @@ import (
 	"github.com/gofiber/fiber/v3/log"
 )
 
+// searchAllProviders searches every registered metadata provider for title in parallel.
+// Results are merged in provider order; providers that fail are skipped.
+func searchAllProviders(title string) []metadata.SearchResult {
+	providerNames := metadata.ListProviders()
+	perProvider := make([][]metadata.SearchResult, len(providerNames))
+	var wg sync.WaitGroup
+
+	for i, providerName := range providerNames {
+		wg.Add(1)
+		go func(i int, pName string) {
+			defer wg.Done()
+
+			provider, err := metadata.GetProvider(pName, "")
+			if err != nil {
+				log.Debugf("Skipping provider %s: %v", pName, err)
+				return
+			}
+
+			providerResults, err := provider.Search(title)
+			if err != nil {
+				log.Debugf("Provider %s search failed: %v", pName, err)
+				return
+			}
+
+			perProvider[i] = providerResults
+		}(i, providerName)
+	}
+	wg.Wait()
+
+	var allResults []metadata.SearchResult
+	for _, providerResults := range perProvider {
+		allResults = append(allResults, providerResults...)
+	}
+	return allResults
+}
+
 // getMediaPathFromChapters returns a representative path for a media by using the first chapter's path
 func getMediaPathFromChapters(mediaSlug string) (string, error) {
 	chapters, err := models.GetChapters(mediaSlug)
@@ -490,46 +527,26 @@ func HandleRefreshMetadata(c fiber.Ctx) error {
 		originalType := existingMedia.Type
 		metadata.UpdateMediaFromAggregated(existingMedia, aggregatedMeta, existingMedia.CoverArtURL)
 
-		// Fetch potential poster URLs from all metadata providers
-		var allPosterURLs []string
-		providerNames := metadata.ListProviders()
-
-		for _, providerName := range providerNames {
-			provider, err := metadata.GetProvider(providerName, "")
-			if err != nil {
-				log.Debugf("Skipping provider %s for potential posters: %v", providerName, err)
+		// Collect unique potential poster URLs from all metadata providers,
+		// keeping results with similarity >= 0.9 and stopping at 20 to keep
+		// the database size reasonable
+		const maxPotentialPosterURLs = 20
+		seenPosterURLs := make(map[string]struct{})
+		var uniquePosterURLs []string
+		for _, result := range searchAllProviders(existingMedia.Name) {
+			if result.SimilarityScore < 0.9 || result.CoverArtURL == "" {
 				continue
 			}
-
-			results, err := provider.Search(existingMedia.Name)
-			if err != nil {
-				log.Debugf("Provider %s search failed for potential posters: %v", providerName, err)
+			if _, ok := seenPosterURLs[result.CoverArtURL]; ok {
 				continue
 			}
-
-			// Filter results by similarity score >= 0.9 and collect URLs
-			for _, result := range results {
-				if result.SimilarityScore >= 0.9 && result.CoverArtURL != "" {
-					allPosterURLs = append(allPosterURLs, result.CoverArtURL)
-				}
-			}
-		}
-
-		// Remove duplicates and limit to reasonable number
-		uniqueURLs := make(map[string]bool)
-		var uniquePosterURLs []string
-		for _, url := range allPosterURLs {
-			if !uniqueURLs[url] {
-				uniqueURLs[url] = true
-				uniquePosterURLs = append(uniquePosterURLs, url)
+			seenPosterURLs[result.CoverArtURL] = struct{}{}
+			uniquePosterURLs = append(uniquePosterURLs, result.CoverArtURL)
+			if len(uniquePosterURLs) == maxPotentialPosterURLs {
+				break
 			}
 		}
 
-		// Limit to top 20 to keep database size reasonable
-		if len(uniquePosterURLs) > 20 {
-			uniquePosterURLs = uniquePosterURLs[:20]
-		}
-
 		existingMedia.PotentialPosterURLs = uniquePosterURLs
 		log.Debugf("Saved %d potential poster URLs from all providers for media '%s'", len(uniquePosterURLs), mangaSlug)
 
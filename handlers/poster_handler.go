@@ -3,10 +3,13 @@ package handlers
 import (
 	"encoding/json"
 	"fmt"
+	"hash/fnv"
 	"os"
 	"path/filepath"
 	"sort"
 	"strconv"
+	"strings"
+	"sync"
 	"time"
 
 	"github.com/gofiber/fiber/v3/log"
@@ -259,7 +262,21 @@ func HandlePosterSet(c fiber.Ctx) error {
 		format := "webp"
 		cachePath := fmt.Sprintf("posters/%s.%s", mangaSlug, format)
 
+		// Encode thumbnails from the decoded upload while the full-size poster is
+		// encoded, rather than re-loading and decoding the saved poster afterwards.
+		// They are only saved once the poster itself is, so a failed upload never
+		// leaves thumbnails that don't match the stored poster.
+		var thumbnails []files.EncodedImage
+		var thumbErr error
+		var thumbWG sync.WaitGroup
+		thumbWG.Add(1)
+		go func() {
+			defer thumbWG.Done()
+			thumbnails, thumbErr = files.EncodePosterThumbnails(img, mangaSlug)
+		}()
+
 		imageData, err := files.EncodeImageToBytes(img, format, posterQuality)
+		thumbWG.Wait()
 		if err != nil {
 			return SendInternalServerError(c, ErrPosterProcessingFailed, err)
 		}
@@ -267,10 +284,12 @@ func HandlePosterSet(c fiber.Ctx) error {
 			return SendInternalServerError(c, ErrPosterSaveFailed, err)
 		}
 
-		// Generate thumbnails
-		if err := files.GenerateThumbnails(cachePath, mangaSlug, fileStore); err != nil {
+		if thumbErr == nil {
+			thumbErr = files.SaveEncodedImages(thumbnails, fileStore)
+		}
+		if thumbErr != nil {
 			// Log error but don't fail the request
-			fmt.Printf("Warning: failed to generate thumbnails: %v\n", err)
+			fmt.Printf("Warning: failed to generate thumbnails: %v\n", thumbErr)
 		}
 
 		storedImageURL := fmt.Sprintf("/api/posters/%s.%s", mangaSlug, format)
@@ -401,24 +420,7 @@ func HandlePosterMetadataSelect(c fiber.Ctx) error {
 		log.Infof("Using %d saved potential poster URLs for media '%s'", len(results), mangaSlug)
 	} else {
 		// Fallback to searching all providers if no saved URLs
-		var allResults []metadata.SearchResult
-		providerNames := metadata.ListProviders()
-
-		for _, providerName := range providerNames {
-			provider, err := metadata.GetProvider(providerName, "")
-			if err != nil {
-				log.Debugf("Skipping provider %s: %v", providerName, err)
-				continue
-			}
-
-			providerResults, err := provider.Search(media.Name)
-			if err != nil {
-				log.Debugf("Provider %s search failed: %v", providerName, err)
-				continue
-			}
-
-			allResults = append(allResults, providerResults...)
-		}
+		allResults := searchAllProviders(media.Name)
 
 		if len(allResults) == 0 {
 			return handleView(c, views.EmptyState("No metadata results found from any provider."))
@@ -441,12 +443,22 @@ func HandlePosterMetadataSelect(c fiber.Ctx) error {
 			return filteredResults[i].SimilarityScore > filteredResults[j].SimilarityScore
 		})
 
-		// Limit to top 20 results to avoid overwhelming the UI
-		if len(filteredResults) > 20 {
-			filteredResults = filteredResults[:20]
+		// Drop repeated cover URLs (keeping the highest-scored one) and limit to top 20
+		// results to avoid overwhelming the UI
+		seenCovers := make(map[string]bool, len(filteredResults))
+		uniqueResults := filteredResults[:0]
+		for _, result := range filteredResults {
+			if result.CoverArtURL == "" || seenCovers[result.CoverArtURL] {
+				continue
+			}
+			seenCovers[result.CoverArtURL] = true
+			uniqueResults = append(uniqueResults, result)
+			if len(uniqueResults) == 20 {
+				break
+			}
 		}
 
-		results = filteredResults
+		results = uniqueResults
 		log.Infof("Using %d filtered live-searched results (score >= 0.9) from all providers for media '%s'", len(results), mangaSlug)
 	}
 
@@ -454,19 +466,70 @@ func HandlePosterMetadataSelect(c fiber.Ctx) error {
 		return handleView(c, views.EmptyState("No metadata poster URLs found."))
 	}
 
-	// Download and cache images locally
+	// Download and cache images locally. Each preview slot records a hash of the
+	// URL it holds and when it was fetched, so reopening the selector reuses
+	// recent covers while the cache stays bounded to one set of slots per media
+	// and a provider replacing the image behind a URL is picked up after a day.
+	// Downloads run in a small pool so one slow or rate-limited host doesn't hold
+	// up the rest.
+	const previewWorkers = 4
+	const previewMaxAge = 24 * time.Hour
+	sem := make(chan struct{}, previewWorkers)
+	var wg sync.WaitGroup
 	for i := range results {
-		if results[i].CoverArtURL != "" {
-			uniqueSlug := fmt.Sprintf("%s_metadata_%d", mangaSlug, i)
-			localURL, err := scheduler.DownloadAndStoreImage(uniqueSlug, results[i].CoverArtURL, fileStore)
-			if err == nil {
-				results[i].CoverArtURL = localURL
-			} else {
+		if results[i].CoverArtURL == "" {
+			continue
+		}
+		uniqueSlug := fmt.Sprintf("%s_metadata_%d", mangaSlug, i)
+		sourcePath := models.MetadataPreviewSourceDir + "/" + uniqueSlug + ".source"
+		urlHash := fnv.New64a()
+		urlHash.Write([]byte(results[i].CoverArtURL))
+		sourceHash := strconv.FormatUint(urlHash.Sum64(), 16)
+		if cached, err := fileStore.Load(sourcePath); err == nil && previewSourceFresh(string(cached), sourceHash, previewMaxAge) {
+			if exists, _ := fileStore.Exists("posters/" + uniqueSlug + ".webp"); exists {
+				results[i].CoverArtURL = fmt.Sprintf("/api/posters/%s.webp", uniqueSlug)
+				continue
+			}
+		}
+		wg.Add(1)
+		sem <- struct{}{}
+		go func() {
+			defer wg.Done()
+			defer func() { <-sem }()
+			// Forget the slot's previous source before overwriting its images, so a
+			// failed download can't leave them attributed to the wrong URL
+			_ = fileStore.Delete(sourcePath)
+			originalURL := results[i].CoverArtURL
+			localURL, err := scheduler.DownloadAndStoreImage(uniqueSlug, originalURL, fileStore)
+			if err != nil {
 				// Keep original URL if download fails
 				fmt.Printf("Warning: failed to download metadata image for %s: %v\n", uniqueSlug, err)
+				return
 			}
-		}
+			results[i].CoverArtURL = localURL
+			if localURL != originalURL {
+				record := sourceHash + " " + strconv.FormatInt(time.Now().Unix(), 10)
+				if err := fileStore.Save(sourcePath, []byte(record)); err != nil {
+					log.Debugf("Failed to record preview source for %s: %v", uniqueSlug, err)
+				}
+			}
+		}()
 	}
+	wg.Wait()
 
 	return handleView(c, views.PosterMetadataSelector(mangaSlug, results))
 }
+
+// previewSourceFresh reports whether a preview slot's "<hash> <unix time>" record
+// matches sourceHash and was written less than maxAge ago.
+func previewSourceFresh(record, sourceHash string, maxAge time.Duration) bool {
+	hash, fetchedAt, ok := strings.Cut(record, " ")
+	if !ok || hash != sourceHash {
+		return false
+	}
+	unix, err := strconv.ParseInt(fetchedAt, 10, 64)
+	if err != nil {
+		return false
+	}
+	return time.Since(time.Unix(unix, 0)) < maxAge
+}
@@ -189,7 +189,7 @@ func main() {
 			}
 
 			// Load disposable email domain blocklist in background
-			go email.InitBlocklist()
+			go email.InitBlocklist(filepath.Join(dataDirectory, "disposable_email_blocklist.conf"))
 
 			// Create a new engine
 			engine := html.NewFileSystem(http.FS(embedded.Views), ".html")
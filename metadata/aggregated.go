@@ -78,6 +78,7 @@ func AggregateMetadata(title string, providerResults map[string]*MediaMetadata)
 	authorMap := make(map[string]bool)
 	artistMap := make(map[string]bool)
 	characterMap := make(map[string]bool)
+	relationMap := make(map[string]bool)
 
 	for providerName, meta := range providerResults {
 		if meta == nil {
@@ -222,17 +223,10 @@ func AggregateMetadata(title string, providerResults map[string]*MediaMetadata)
 			aggregated.Magazine = meta.Magazine
 		}
 
-		// Add relations
+		// Add relations (deduplicated by title)
 		for _, relation := range meta.Relations {
-			// Simple deduplication by title
-			found := false
-			for _, existing := range aggregated.Relations {
-				if existing.Title == relation.Title {
-					found = true
-					break
-				}
-			}
-			if !found {
+			if !relationMap[relation.Title] {
+				relationMap[relation.Title] = true
 				aggregated.Relations = append(aggregated.Relations, relation)
 			}
 		}
@@ -5,9 +5,11 @@ import (
 	"fmt"
 	"net/http"
 	"net/url"
+	"strconv"
 	"strings"
 
 	"github.com/alexander-bruun/magi/utils/text"
+	"github.com/gofiber/fiber/v3/log"
 )
 
 const jikanBaseURL = "https://api.jikan.moe/v4"
@@ -17,21 +19,32 @@ type JikanProvider struct {
 	BaseProvider
 }
 
+// jikanHTTPClient is shared by every Jikan provider instance instead of building a
+// client per lookup. Keep-alives stay disabled for Jikan, as they always have been,
+// so each request uses a fresh connection.
+var jikanHTTPClient = &http.Client{
+	Transport: newJikanTransport(),
+	CheckRedirect: func(req *http.Request, via []*http.Request) error {
+		return http.ErrUseLastResponse
+	},
+}
+
+// newJikanTransport clones the default transport (keeping proxy, dial timeouts and
+// HTTP/2 support) with keep-alives disabled.
+func newJikanTransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.DisableKeepAlives = true
+	return t
+}
+
 // NewJikanProvider creates a new Jikan API metadata provider
 func NewJikanProvider(apiToken string) Provider {
 	return &JikanProvider{
 		BaseProvider: BaseProvider{
 			ProviderName: "jikan",
 			APIToken:     apiToken,
-			Client: &http.Client{
-				Transport: &http.Transport{
-					DisableKeepAlives: true,
-				},
-				CheckRedirect: func(req *http.Request, via []*http.Request) error {
-					return http.ErrUseLastResponse
-				},
-			},
-			BaseURL: jikanBaseURL,
+			Client:       jikanHTTPClient,
+			BaseURL:      jikanBaseURL,
 		},
 	}
 }
@@ -45,19 +58,25 @@ func (j *JikanProvider) FindBestMatch(title string) (*MediaMetadata, error) {
 }
 
 func (j *JikanProvider) Search(title string) ([]SearchResult, error) {
-	// Search both anime and manga endpoints
+	// Search both anime and manga endpoints. The requests run one after the
+	// other: Jikan's public API allows about 3 requests per second, and
+	// providers are already queried in parallel by several indexer workers.
 	var allResults []SearchResult
 
 	// Search anime
 	animeResults, err := j.searchMediaType(title, "anime")
 	if err == nil {
 		allResults = append(allResults, animeResults...)
+	} else {
+		log.Debugf("Jikan anime search for '%s' failed: %v", title, err)
 	}
 
 	// Search manga
 	mangaResults, err := j.searchMediaType(title, "manga")
 	if err == nil {
 		allResults = append(allResults, mangaResults...)
+	} else {
+		log.Debugf("Jikan manga search for '%s' failed: %v", title, err)
 	}
 
 	if len(allResults) == 0 {
@@ -122,32 +141,8 @@ func (j *JikanProvider) searchMediaType(title, mediaType string) ([]SearchResult
 	results := make([]SearchResult, 0, len(response.Data))
 	titleLower := strings.ToLower(title)
 
-	for _, media := range response.Data {
-		coverURL := ""
-		if media.Images.JPG.LargeImageURL != "" {
-			coverURL = media.Images.JPG.LargeImageURL
-		} else if media.Images.JPG.ImageURL != "" {
-			coverURL = media.Images.JPG.ImageURL
-		}
-
-		year := 0
-		if media.Published.From != "" {
-			fmt.Sscanf(media.Published.From, "%d", &year)
-		} else if media.Aired.From != "" {
-			fmt.Sscanf(media.Aired.From, "%d", &year)
-		}
-
-		// Extract tags from genres, themes, and demographics
-		var tags []string
-		for _, genre := range media.Genres {
-			tags = append(tags, genre.Name)
-		}
-		for _, theme := range media.Themes {
-			tags = append(tags, theme.Name)
-		}
-		for _, demo := range media.Demographics {
-			tags = append(tags, demo.Name)
-		}
+	for i := range response.Data {
+		media := &response.Data[i]
 
 		// Use English title if available, otherwise use default title
 		displayTitle := media.Title
@@ -156,13 +151,13 @@ func (j *JikanProvider) searchMediaType(title, mediaType string) ([]SearchResult
 		}
 
 		results = append(results, SearchResult{
-			ID:              fmt.Sprintf("%s:%d", mediaType, media.MalID),
+			ID:              mediaType + ":" + strconv.Itoa(media.MalID),
 			Title:           displayTitle,
 			Description:     media.Synopsis,
-			CoverArtURL:     coverURL,
-			Year:            year,
+			CoverArtURL:     jikanCoverURL(media),
+			Year:            jikanYear(media),
 			SimilarityScore: text.CompareStrings(titleLower, strings.ToLower(displayTitle)),
-			Tags:            tags,
+			Tags:            jikanTags(media),
 		})
 	}
 
@@ -208,21 +203,49 @@ func (j *JikanProvider) GetMetadata(id string) (*MediaMetadata, error) {
 	return metadata, nil
 }
 
-func (j *JikanProvider) convertToMediaMetadata(data *jikanMediaData) *MediaMetadata {
-	coverURL := ""
+// jikanCoverURL returns the largest available cover image URL.
+func jikanCoverURL(data *jikanMediaData) string {
 	if data.Images.JPG.LargeImageURL != "" {
-		coverURL = data.Images.JPG.LargeImageURL
-	} else if data.Images.JPG.ImageURL != "" {
-		coverURL = data.Images.JPG.ImageURL
+		return data.Images.JPG.LargeImageURL
+	}
+	return data.Images.JPG.ImageURL
+}
+
+// jikanYear returns the year from the publication (or airing) start date,
+// which Jikan formats as an ISO timestamp such as "2010-01-01T00:00:00+00:00".
+func jikanYear(data *jikanMediaData) int {
+	from := data.Published.From
+	if from == "" {
+		from = data.Aired.From
+	}
+	end := 0
+	for end < len(from) && from[end] >= '0' && from[end] <= '9' {
+		end++
 	}
+	year, _ := strconv.Atoi(from[:end])
+	return year
+}
 
-	year := 0
-	if data.Published.From != "" {
-		fmt.Sscanf(data.Published.From, "%d", &year)
-	} else if data.Aired.From != "" {
-		fmt.Sscanf(data.Aired.From, "%d", &year)
+// jikanTags collects genres, themes and demographics into a single tag list.
+func jikanTags(data *jikanMediaData) []string {
+	n := len(data.Genres) + len(data.Themes) + len(data.Demographics)
+	if n == 0 {
+		return nil
+	}
+	tags := make([]string, 0, n)
+	for _, genre := range data.Genres {
+		tags = append(tags, genre.Name)
+	}
+	for _, theme := range data.Themes {
+		tags = append(tags, theme.Name)
+	}
+	for _, demo := range data.Demographics {
+		tags = append(tags, demo.Name)
 	}
+	return tags
+}
 
+func (j *JikanProvider) convertToMediaMetadata(data *jikanMediaData) *MediaMetadata {
 	// Use English title if available, otherwise use default title
 	displayTitle := data.Title
 	if data.TitleEnglish != "" {
@@ -232,22 +255,12 @@ func (j *JikanProvider) convertToMediaMetadata(data *jikanMediaData) *MediaMetad
 	metadata := &MediaMetadata{
 		Title:         displayTitle,
 		Description:   data.Synopsis,
-		Year:          year,
+		Year:          jikanYear(data),
 		Status:        convertJikanStatus(data.Status),
 		ContentRating: convertJikanRating(data.Demographics),
-		CoverArtURL:   coverURL,
+		CoverArtURL:   jikanCoverURL(data),
 		Type:          convertJikanType(data.Type),
-	}
-
-	// Extract tags from genres, themes, and demographics
-	for _, genre := range data.Genres {
-		metadata.Tags = append(metadata.Tags, genre.Name)
-	}
-	for _, theme := range data.Themes {
-		metadata.Tags = append(metadata.Tags, theme.Name)
-	}
-	for _, demo := range data.Demographics {
-		metadata.Tags = append(metadata.Tags, demo.Name)
+		Tags:          jikanTags(data),
 	}
 
 	// Extract alternative titles
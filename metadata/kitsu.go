@@ -25,7 +25,7 @@ func NewKitsuProvider(apiToken string) Provider {
 		BaseProvider: BaseProvider{
 			ProviderName: "kitsu",
 			APIToken:     apiToken,
-			Client:       &http.Client{},
+			Client:       defaultHTTPClient,
 			BaseURL:      kitsuBaseURL,
 		},
 	}
@@ -24,7 +24,7 @@ func NewMangaDexProvider(apiToken string) Provider {
 		BaseProvider: BaseProvider{
 			ProviderName: "mangadex",
 			APIToken:     apiToken,
-			Client:       &http.Client{},
+			Client:       defaultHTTPClient,
 			BaseURL:      mangadexBaseURL,
 		},
 	}
@@ -209,7 +209,7 @@ func (m *MangaDexProvider) convertToMediaMetadata(detail *mangadexMediaDetail) *
 	for _, rel := range detail.Relationships {
 		switch rel.Type {
 		case "author":
-			if name, ok := rel.Attributes["name"].(string); ok && name != "" {
+			if name := rel.Attributes.Name; name != "" {
 				authorInfo := AuthorInfo{
 					Name: name,
 					Role: "author",
@@ -220,7 +220,7 @@ func (m *MangaDexProvider) convertToMediaMetadata(detail *mangadexMediaDetail) *
 				}
 			}
 		case "artist":
-			if name, ok := rel.Attributes["name"].(string); ok && name != "" {
+			if name := rel.Attributes.Name; name != "" {
 				artistInfo := AuthorInfo{
 					Name: name,
 					Role: "artist",
@@ -267,10 +267,16 @@ type mangadexTag struct {
 	} `json:"attributes"`
 }
 
+// mangadexRelationship declares only the attributes we read from authors, artists
+// and cover art, so the decoder skips the rest (biographies, descriptions, ...)
+// instead of building a generic map for every related entity.
 type mangadexRelationship struct {
-	ID         string         `json:"id"`
-	Type       string         `json:"type"`
-	Attributes map[string]any `json:"attributes"`
+	ID         string `json:"id"`
+	Type       string `json:"type"`
+	Attributes struct {
+		Name     string `json:"name"`
+		FileName string `json:"fileName"`
+	} `json:"attributes"`
 }
 
 // Helper functions
@@ -324,7 +330,7 @@ func extractDescription(descriptions map[string]string) string {
 func extractCoverURL(mangaID string, relationships []mangadexRelationship) string {
 	for _, rel := range relationships {
 		if rel.Type == "cover_art" {
-			if fileName, ok := rel.Attributes["fileName"].(string); ok {
+			if fileName := rel.Attributes.FileName; fileName != "" {
 				return fmt.Sprintf("https://uploads.mangadex.org/covers/%s/%s", mangaID, fileName)
 			}
 		}
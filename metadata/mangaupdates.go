@@ -24,7 +24,7 @@ func NewMangaUpdatesProvider(apiToken string) Provider {
 		BaseProvider: BaseProvider{
 			ProviderName: "mangaupdates",
 			APIToken:     apiToken,
-			Client:       &http.Client{},
+			Client:       defaultHTTPClient,
 			BaseURL:      mangaupdatesBaseURL,
 		},
 	}
@@ -248,7 +248,6 @@ type mangaupdatesSearchResponse struct {
 type mangaupdatesSearchResult struct {
 	Record   mangaupdatesSeriesDetail `json:"record"`
 	HitTitle string                   `json:"hit_title"`
-	Metadata map[string]interface{}   `json:"metadata"`
 }
 
 type mangaupdatesSeriesDetail struct {
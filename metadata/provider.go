@@ -5,6 +5,7 @@ import (
 	"errors"
 	"fmt"
 	"net/http"
+	"time"
 )
 
 // MediaMetadata represents the standardized metadata structure returned by all providers
@@ -122,12 +123,28 @@ func (b *BaseProvider) GetCoverImageURL(metadata *MediaMetadata) string {
 	return metadata.CoverArtURL
 }
 
-// HTTPClient returns the provider's HTTP client, falling back to a default client.
+// defaultHTTPClient is shared by providers that don't configure their own client.
+var defaultHTTPClient = &http.Client{
+	Transport: newProviderTransport(90 * time.Second),
+}
+
+// newProviderTransport clones the default transport (keeping proxy, dial timeouts
+// and HTTP/2 support) with room for more idle connections per host than the
+// default two, so concurrent indexer workers querying the same API reuse
+// connections instead of closing and re-handshaking them.
+func newProviderTransport(idleConnTimeout time.Duration) *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConnsPerHost = 8
+	t.IdleConnTimeout = idleConnTimeout
+	return t
+}
+
+// HTTPClient returns the provider's HTTP client, falling back to a shared default client.
 func (b *BaseProvider) HTTPClient() *http.Client {
 	if b.Client != nil {
 		return b.Client
 	}
-	return &http.Client{}
+	return defaultHTTPClient
 }
 
 // DoGetJSON performs an HTTP GET and decodes the JSON response into target.
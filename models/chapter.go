@@ -1,6 +1,7 @@
 package models
 
 import (
+	"cmp"
 	"database/sql"
 	"errors"
 	"fmt"
@@ -392,21 +393,60 @@ func GetAdjacentChapters(chapters []Chapter, chapterID, userName string) (prevSl
 
 // Helper functions
 
+// sortChaptersByNumber sorts chapters by the first number in their name, then by library.
+// Numbers are extracted once per chapter up front rather than on every comparison.
 func sortChaptersByNumber(chapters []Chapter) {
-	sort.Slice(chapters, func(i, j int) bool {
-		numI, errI := text.ExtractNumber(chapters[i].Name)
-		numJ, errJ := text.ExtractNumber(chapters[j].Name)
-		if errI != nil || errJ != nil {
+	nums := make([]int, len(chapters))
+	hasNum := make([]bool, len(chapters))
+	order := make([]int, len(chapters))
+	for i := range chapters {
+		num, err := text.ExtractNumber(chapters[i].Name)
+		nums[i], hasNum[i] = num, err == nil
+		order[i] = i
+	}
+
+	sort.Slice(order, func(a, b int) bool {
+		i, j := order[a], order[b]
+		if !hasNum[i] || !hasNum[j] {
 			if chapters[i].Name != chapters[j].Name {
 				return chapters[i].Name < chapters[j].Name
 			}
 			return chapters[i].LibraryName < chapters[j].LibraryName
 		}
-		if numI != numJ {
-			return numI < numJ
+		if nums[i] != nums[j] {
+			return nums[i] < nums[j]
 		}
 		return chapters[i].LibraryName < chapters[j].LibraryName
 	})
+
+	sorted := make([]Chapter, len(chapters))
+	for k, i := range order {
+		sorted[k] = chapters[i]
+	}
+	copy(chapters, sorted)
+}
+
+// sortByKeys sorts items by precomputed keys, where keys[i] belongs to items[i].
+// Like sortChaptersByNumber it sorts an index permutation and copies the items
+// into place once, so keys are never recomputed during comparisons.
+func sortByKeys[T any, K cmp.Ordered](items []T, keys []K, asc bool) {
+	order := make([]int, len(items))
+	for i := range order {
+		order[i] = i
+	}
+
+	sort.Slice(order, func(a, b int) bool {
+		if asc {
+			return keys[order[a]] < keys[order[b]]
+		}
+		return keys[order[a]] > keys[order[b]]
+	})
+
+	sorted := make([]T, len(items))
+	for k, i := range order {
+		sorted[k] = items[i]
+	}
+	copy(items, sorted)
 }
 
 func indexOfChapterByID(chapters []Chapter, chapterID string) int {
@@ -566,11 +606,7 @@ func GetChaptersByMediaSlug(mediaSlug string, limit int, maxPremiumChapters int,
 	}
 
 	// Sort chapters by extracted chapter number descending
-	sort.Slice(chapters, func(i, j int) bool {
-		numI := extractChapterNumber(chapters[i].Name)
-		numJ := extractChapterNumber(chapters[j].Name)
-		return numI > numJ
-	})
+	sortChaptersByExtractedNumber(chapters, false)
 
 	// Set IsPremium for chapters within maxPremiumChapters and within time
 	now := time.Now()
@@ -662,15 +698,7 @@ func GetChaptersByMediaSlugPaginated(mediaSlug string, offset int, limit int, so
 	}
 
 	// Sort chapters by extracted chapter number
-	ascending := sorting == "oldest"
-	sort.Slice(chapters, func(i, j int) bool {
-		numI := extractChapterNumber(chapters[i].Name)
-		numJ := extractChapterNumber(chapters[j].Name)
-		if ascending {
-			return numI < numJ
-		}
-		return numI > numJ
-	})
+	sortChaptersByExtractedNumber(chapters, sorting == "oldest")
 
 	// Apply pagination
 	if offset >= len(chapters) {
@@ -809,11 +837,12 @@ func GetRecentSeriesWithChapters(limit int, maxPremiumChapters int, premiumDurat
 	return result, nil
 }
 
+// chapterNumberRegex matches patterns like "Chapter 123", "Vol 1 Ch 123", "Volume 1", etc.
+var chapterNumberRegex = regexp.MustCompile(`(?i)(?:chapter|ch\.?|episode|ep\.?|volume|vol\.?)\s*(\d+)`)
+
 // extractChapterNumber extracts the chapter number from a chapter name
 func extractChapterNumber(name string) int {
-	// Look for patterns like "Chapter 123", "Vol 1 Ch 123", "Volume 1", etc.
-	re := regexp.MustCompile(`(?i)(?:chapter|ch\.?|episode|ep\.?|volume|vol\.?)\s*(\d+)`)
-	matches := re.FindStringSubmatch(name)
+	matches := chapterNumberRegex.FindStringSubmatch(name)
 	if len(matches) > 1 {
 		if num, err := strconv.Atoi(matches[1]); err == nil {
 			return num
@@ -826,6 +855,16 @@ func extractChapterNumber(name string) int {
 	return -1
 }
 
+// sortChaptersByExtractedNumber sorts chapters by extractChapterNumber, running
+// the regex once per chapter instead of twice per comparison.
+func sortChaptersByExtractedNumber(chapters []Chapter, ascending bool) {
+	nums := make([]int, len(chapters))
+	for i := range chapters {
+		nums[i] = extractChapterNumber(chapters[i].Name)
+	}
+	sortByKeys(chapters, nums, ascending)
+}
+
 // MediaEnrichmentData contains preloaded data for a media item
 type MediaEnrichmentData struct {
 	MediaSlug         string
@@ -99,17 +99,9 @@ func SortMedias(media []Media, key, order string) {
 	asc := strings.ToLower(order) != "desc"
 	switch key {
 	case "name":
-		if asc {
-			sort.Slice(media, func(i, j int) bool { return strings.ToLower(media[i].Name) < strings.ToLower(media[j].Name) })
-		} else {
-			sort.Slice(media, func(i, j int) bool { return strings.ToLower(media[i].Name) > strings.ToLower(media[j].Name) })
-		}
+		sortMediasByLowerKey(media, func(m *Media) string { return m.Name }, asc)
 	case "type":
-		if asc {
-			sort.Slice(media, func(i, j int) bool { return strings.ToLower(media[i].Type) < strings.ToLower(media[j].Type) })
-		} else {
-			sort.Slice(media, func(i, j int) bool { return strings.ToLower(media[i].Type) > strings.ToLower(media[j].Type) })
-		}
+		sortMediasByLowerKey(media, func(m *Media) string { return m.Type }, asc)
 	case "year":
 		if asc {
 			sort.Slice(media, func(i, j int) bool { return media[i].Year < media[j].Year })
@@ -117,21 +109,9 @@ func SortMedias(media []Media, key, order string) {
 			sort.Slice(media, func(i, j int) bool { return media[i].Year > media[j].Year })
 		}
 	case "status":
-		if asc {
-			sort.Slice(media, func(i, j int) bool { return strings.ToLower(media[i].Status) < strings.ToLower(media[j].Status) })
-		} else {
-			sort.Slice(media, func(i, j int) bool { return strings.ToLower(media[i].Status) > strings.ToLower(media[j].Status) })
-		}
+		sortMediasByLowerKey(media, func(m *Media) string { return m.Status }, asc)
 	case "content_rating":
-		if asc {
-			sort.Slice(media, func(i, j int) bool {
-				return strings.ToLower(media[i].ContentRating) < strings.ToLower(media[j].ContentRating)
-			})
-		} else {
-			sort.Slice(media, func(i, j int) bool {
-				return strings.ToLower(media[i].ContentRating) > strings.ToLower(media[j].ContentRating)
-			})
-		}
+		sortMediasByLowerKey(media, func(m *Media) string { return m.ContentRating }, asc)
 	case "created_at":
 		if asc {
 			sort.Slice(media, func(i, j int) bool { return media[i].CreatedAt.Before(media[j].CreatedAt) })
@@ -158,12 +138,18 @@ func SortMedias(media []Media, key, order string) {
 		}
 	default:
 		// default already handled by NormalizeSort -> name
-		if asc {
-			sort.Slice(media, func(i, j int) bool { return strings.ToLower(media[i].Name) < strings.ToLower(media[j].Name) })
-		} else {
-			sort.Slice(media, func(i, j int) bool { return strings.ToLower(media[i].Name) > strings.ToLower(media[j].Name) })
-		}
+		sortMediasByLowerKey(media, func(m *Media) string { return m.Name }, asc)
+	}
+}
+
+// sortMediasByLowerKey sorts medias case-insensitively by field, lowercasing each
+// value once up front instead of twice per comparison.
+func sortMediasByLowerKey(media []Media, field func(*Media) string, asc bool) {
+	keys := make([]string, len(media))
+	for i := range media {
+		keys[i] = strings.ToLower(field(&media[i]))
 	}
+	sortByKeys(media, keys, asc)
 }
 
 // Media represents the media table schema
@@ -256,17 +242,33 @@ func scanMediaRow(s Scanner) (Media, error) {
 	m.CreatedAt = time.Unix(createdAt, 0)
 	m.UpdatedAt = time.Unix(updatedAt, 0)
 
-	json.Unmarshal(authorsJSON, &m.Authors)
-	json.Unmarshal(artistsJSON, &m.Artists)
-	json.Unmarshal(genresJSON, &m.Genres)
-	json.Unmarshal(charactersJSON, &m.Characters)
-	json.Unmarshal(alternativeTitlesJSON, &m.AlternativeTitles)
-	json.Unmarshal(attributionLinksJSON, &m.AttributionLinks)
-	json.Unmarshal(potentialPosterURLsJSON, &m.PotentialPosterURLs)
+	unmarshalJSONColumn(authorsJSON, &m.Authors)
+	unmarshalJSONColumn(artistsJSON, &m.Artists)
+	unmarshalJSONColumn(genresJSON, &m.Genres)
+	unmarshalJSONColumn(charactersJSON, &m.Characters)
+	unmarshalJSONColumn(alternativeTitlesJSON, &m.AlternativeTitles)
+	unmarshalJSONColumn(attributionLinksJSON, &m.AttributionLinks)
+	unmarshalJSONColumn(potentialPosterURLsJSON, &m.PotentialPosterURLs)
 
 	return m, nil
 }
 
+// unmarshalJSONColumn decodes a JSON array column, skipping the decoder for the
+// empty defaults most rows carry so listing queries don't pay for them. The
+// result matches json.Unmarshal: '[]' gives a non-nil empty slice, so saving the
+// media back writes '[]' rather than 'null', while empty and 'null' columns
+// leave the field nil.
+func unmarshalJSONColumn[T any](data []byte, v *[]T) {
+	switch string(data) {
+	case "[]":
+		*v = []T{}
+		return
+	case "", "null":
+		return
+	}
+	json.Unmarshal(data, v)
+}
+
 // CreateMedia adds a new media to the database
 func CreateMedia(media Media) error {
 	exists, err := MediaExists(media.Slug)
@@ -561,6 +563,10 @@ func DeleteMedia(slug string) error {
 	return DeleteRecord(`DELETE FROM media WHERE slug = ?`, slug)
 }
 
+// MetadataPreviewSourceDir holds the records of which cover URL each metadata poster
+// preview slot was fetched from. It sits outside posters/ so they aren't publicly served.
+const MetadataPreviewSourceDir = "poster_sources"
+
 // deletePosterImages deletes the poster image files for a media
 func deletePosterImages(slug string) {
 	dataDir := GetDataDirectory()
@@ -589,6 +595,26 @@ func deletePosterImages(slug string) {
 	if err := os.Remove(smallPath); err != nil && !os.IsNotExist(err) {
 		log.Warnf("Failed to delete poster small image %s: %v", smallPath, err)
 	}
+
+	deleteMetadataPreviews(dataDir, slug)
+}
+
+// deleteMetadataPreviews deletes the metadata poster preview images for a media,
+// in every size, together with their source records.
+func deleteMetadataPreviews(dataDir, slug string) {
+	pattern := slug + "_metadata_[0-9]*"
+	for _, dir := range []string{"posters", MetadataPreviewSourceDir} {
+		matches, err := filepath.Glob(filepath.Join(dataDir, dir, pattern))
+		if err != nil {
+			log.Warnf("Failed to list metadata poster previews for %s: %v", slug, err)
+			continue
+		}
+		for _, path := range matches {
+			if err := os.Remove(path); err != nil && !os.IsNotExist(err) {
+				log.Warnf("Failed to delete metadata poster preview %s: %v", path, err)
+			}
+		}
+	}
 }
 
 // SearchMedias filters, sorts, and paginates media based on provided criteria
@@ -791,7 +817,7 @@ func GetMediasBySlugs(slugs []string) ([]Media, error) {
 
 	// Batch load tags for all media
 	if len(medias) > 0 {
-		tagMap, err := GetAllMediaTagsMap()
+		tagMap, err := GetMediaTagsMap(mediaSlugsOf(medias))
 		if err != nil {
 			log.Errorf("Failed to load tags for media batch: %v", err)
 			// Continue without tags rather than failing
@@ -928,7 +954,7 @@ func GetTopMediasByPeriod(period string, limit int, accessibleLibraries []string
 
 	// Batch load tags for all media
 	if len(mediaList) > 0 {
-		tagMap, err := GetAllMediaTagsMap()
+		tagMap, err := GetMediaTagsMap(mediaSlugsOf(mediaList))
 		if err != nil {
 			log.Errorf("Failed to load tags for top media: %v", err)
 			// Continue without tags rather than failing
@@ -946,6 +972,15 @@ func GetTopMediasByPeriod(period string, limit int, accessibleLibraries []string
 
 // Helper functions
 
+// mediaSlugsOf returns the slugs of the given media, for batched lookups.
+func mediaSlugsOf(medias []Media) []string {
+	slugs := make([]string, len(medias))
+	for i := range medias {
+		slugs[i] = medias[i].Slug
+	}
+	return slugs
+}
+
 func loadAllMedias(media *[]Media) error {
 	return loadAllMediasWithTags(media, false)
 }
@@ -1597,7 +1632,7 @@ func SearchMediasWithOptions(opts SearchOptions) ([]Media, int64, error) {
 
 	// Load tags if needed for display (only if tags were filtered)
 	if len(opts.Tags) > 0 && len(medias) > 0 {
-		tagMap, err := GetAllMediaTagsMap()
+		tagMap, err := GetMediaTagsMap(mediaSlugsOf(medias))
 		if err != nil {
 			log.Errorf("Failed to load tags for media: %v", err)
 		} else {
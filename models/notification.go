@@ -242,6 +242,7 @@ func NotifyUsersOfNewChapters(mangaSlug string, newChapterSlugs []string) error
 		slug        string
 		name        string
 		librarySlug string
+		num         int // extracted chapter number, -1 if none
 	}
 
 	var newChapters []chapterInfo
@@ -250,6 +251,7 @@ func NotifyUsersOfNewChapters(mangaSlug string, newChapterSlugs []string) error
 		if err := rows.Scan(&ch.slug, &ch.name, &ch.librarySlug); err != nil {
 			continue
 		}
+		ch.num = extractChapterNumber(ch.name)
 		newChapters = append(newChapters, ch)
 	}
 
@@ -259,10 +261,10 @@ func NotifyUsersOfNewChapters(mangaSlug string, newChapterSlugs []string) error
 		return tx.Commit() // Nothing to do, but commit the transaction
 	}
 
-	// Sort chapters by chapter number for proper range display
+	// Sort chapters by chapter number for proper range display, using the number
+	// extracted once per chapter while scanning
 	sort.Slice(newChapters, func(i, j int) bool {
-		numI := extractChapterNumber(newChapters[i].name)
-		numJ := extractChapterNumber(newChapters[j].name)
+		numI, numJ := newChapters[i].num, newChapters[j].num
 		// Handle cases where extraction fails (-1)
 		if numI == -1 && numJ == -1 {
 			return newChapters[i].name < newChapters[j].name
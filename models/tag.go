@@ -1,7 +1,9 @@
 package models
 
 import (
+	"database/sql"
 	"fmt"
+	"strings"
 )
 
 // GetTagsForMedia returns a slice of tag names associated with the media slug
@@ -97,7 +99,39 @@ func GetAllMediaTagsMap() (map[string][]string, error) {
 		return nil, err
 	}
 	defer rows.Close()
+	return scanMediaTagsMap(rows)
+}
+
+// maxTagLookupSlugs bounds the IN clause of GetMediaTagsMap; larger batches read the whole table.
+const maxTagLookupSlugs = 500
+
+// GetMediaTagsMap returns a mapping from media_slug to its tags for only the given slugs,
+// so paginated results don't have to load the tags of every media in the database.
+func GetMediaTagsMap(slugs []string) (map[string][]string, error) {
+	if len(slugs) == 0 {
+		return map[string][]string{}, nil
+	}
+	if len(slugs) > maxTagLookupSlugs {
+		return GetAllMediaTagsMap()
+	}
+
+	placeholders := strings.Repeat("?,", len(slugs))
+	placeholders = placeholders[:len(placeholders)-1]
+	args := make([]any, len(slugs))
+	for i, slug := range slugs {
+		args[i] = slug
+	}
+
+	rows, err := db.Query(fmt.Sprintf(`SELECT media_slug, tag FROM media_tags WHERE media_slug IN (%s)`, placeholders), args...)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	return scanMediaTagsMap(rows)
+}
 
+// scanMediaTagsMap collects (media_slug, tag) rows into a map keyed by slug.
+func scanMediaTagsMap(rows *sql.Rows) (map[string][]string, error) {
 	m := make(map[string][]string)
 	for rows.Next() {
 		var slug, tag string
@@ -109,7 +143,7 @@ func GetAllMediaTagsMap() (map[string][]string, error) {
 		}
 		m[slug] = append(m[slug], tag)
 	}
-	return m, nil
+	return m, rows.Err()
 }
 
 // GetTagsForUserFavorites returns all distinct tags for mangas favorited by the user
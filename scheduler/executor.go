@@ -90,12 +90,49 @@ func (j *SubscriptionExpiryJob) Name() string {
 
 // LogStreamManager manages WebSocket connections for log streaming
 type LogStreamManager struct {
-	clients map[string][]*websocket.Conn // key -> list of connections
+	clients map[string][]*logClient // key -> list of connections
 	mu      sync.RWMutex
 }
 
 var logStreamManager = &LogStreamManager{
-	clients: make(map[string][]*websocket.Conn),
+	clients: make(map[string][]*logClient),
+}
+
+// logClientBuffer is how many log lines may queue for a client before new lines are dropped.
+const logClientBuffer = 256
+
+// logClient is a log stream connection with its own writer goroutine, so callers of
+// BroadcastLog never block on the network and writes to a connection are serialized.
+type logClient struct {
+	conn *websocket.Conn
+	send chan []byte
+}
+
+// writeLoop sends queued log lines, coalescing everything pending into one frame.
+func (lc *logClient) writeLoop(key string) {
+	failed := false
+	for payload := range lc.send {
+		if failed {
+			continue
+		}
+	drain:
+		for {
+			select {
+			case more, ok := <-lc.send:
+				if !ok {
+					break drain
+				}
+				payload = append(payload, more...)
+			default:
+				break drain
+			}
+		}
+		if err := lc.conn.WriteMessage(websocket.TextMessage, payload); err != nil {
+			log.Debugf("[WEBSOCKET] Failed to write to client for key %s: %v (will clean up)", key, err)
+			failed = true
+			go unregisterClient(key, lc.conn)
+		}
+	}
 }
 
 // Execution contexts for running scripts (to allow cancellation)
@@ -161,16 +198,15 @@ func BroadcastLog(key string, logType string, message string) {
 	// Console log to verify we're getting logs
 	log.Debugf("[BROADCAST] Key %s [%s]: %s", key, logType, message)
 
+	// Hold the read lock for the whole broadcast: sends happen under it so
+	// unregisterClient can't close a channel mid-send, and they never block.
 	logStreamManager.mu.RLock()
-	connections, exists := logStreamManager.clients[key]
-	if !exists || len(connections) == 0 {
-		logStreamManager.mu.RUnlock()
+	defer logStreamManager.mu.RUnlock()
+	clients := logStreamManager.clients[key]
+	if len(clients) == 0 {
 		log.Debugf("No active WebSocket connections for key %s", key)
 		return
 	}
-	conns := make([]*websocket.Conn, len(connections))
-	copy(conns, connections)
-	logStreamManager.mu.RUnlock()
 
 	// Create HTML for HTMX WebSocket extension
 	// Send content that will be appended to #log-output-container
@@ -181,49 +217,38 @@ func BroadcastLog(key string, logType string, message string) {
 	ansiConverted := ansiToHTML(escapedMessage)
 	// Send a template fragment that HTMX can parse and inject
 	htmlPayload := fmt.Sprintf(`<div hx-swap-oob="beforeend:#log-output-container" style="margin: 0; padding: 0;"><span style="white-space: nowrap;">%s</span></div>`, ansiConverted)
-	payloadBytes := []byte(htmlPayload)
 
-	log.Debugf("[WEBSOCKET] Broadcasting to %d clients for key %s: %s", len(conns), key, htmlPayload)
-
-	// Track failed connections to clean up
-	var failedConns []*websocket.Conn
-
-	for i, conn := range conns {
-		if err := conn.WriteMessage(websocket.TextMessage, payloadBytes); err != nil {
-			log.Debugf("[WEBSOCKET] Failed to write to client %d for key %s: %v (will clean up)", i, key, err)
-			failedConns = append(failedConns, conn)
-		} else {
-			log.Debugf("[WEBSOCKET] Successfully sent message to client %d for key %s", i, key)
-		}
-	}
-
-	// Clean up failed connections
-	if len(failedConns) > 0 {
-		for _, failedConn := range failedConns {
-			unregisterClient(key, failedConn)
+	// Queue the payload for each client's writer. Each client gets its own copy
+	// since writeLoop appends queued payloads onto the one it received.
+	log.Debugf("[WEBSOCKET] Broadcasting to %d clients for key %s: %s", len(clients), key, htmlPayload)
+	for i, client := range clients {
+		select {
+		case client.send <- []byte(htmlPayload):
+		default:
+			log.Debugf("[WEBSOCKET] Client %d for key %s is falling behind, dropping log line", i, key)
 		}
 	}
 }
 
 func registerClient(key string, conn *websocket.Conn) {
+	client := &logClient{conn: conn, send: make(chan []byte, logClientBuffer)}
+	go client.writeLoop(key)
+
 	logStreamManager.mu.Lock()
 	defer logStreamManager.mu.Unlock()
-
-	if logStreamManager.clients[key] == nil {
-		logStreamManager.clients[key] = make([]*websocket.Conn, 0)
-	}
-	logStreamManager.clients[key] = append(logStreamManager.clients[key], conn)
+	logStreamManager.clients[key] = append(logStreamManager.clients[key], client)
 }
 
 func unregisterClient(key string, conn *websocket.Conn) {
 	logStreamManager.mu.Lock()
 	defer logStreamManager.mu.Unlock()
 
-	if connections, exists := logStreamManager.clients[key]; exists {
-		for i, c := range connections {
-			if c == conn {
-				logStreamManager.clients[key] = append(connections[:i], connections[i+1:]...)
-				conn.Close() // Close the connection
+	if clients, exists := logStreamManager.clients[key]; exists {
+		for i, c := range clients {
+			if c.conn == conn {
+				logStreamManager.clients[key] = append(clients[:i], clients[i+1:]...)
+				close(c.send) // Stops the writer goroutine
+				conn.Close()  // Close the connection
 				break
 			}
 		}
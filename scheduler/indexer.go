@@ -4,14 +4,16 @@ import (
 	"archive/zip"
 	"database/sql"
 	"encoding/xml"
+	"errors"
 	"fmt"
 	"io"
-	"io/fs"
+	"math/rand/v2"
 	"os"
 	"path/filepath"
 	"regexp"
 	"sort"
 	"strings"
+	"sync"
 	"time"
 	"unicode"
 
@@ -53,6 +55,9 @@ const (
 	localServerBaseURL = "/api/posters"
 )
 
+// StandalonePosterFiles lists the poster image names checked in a media directory, in priority order
+var StandalonePosterFiles = []string{"poster.webp", "poster.jpg", "poster.jpeg", "poster.png", "thumbnail.webp", "thumbnail.jpg", "thumbnail.jpeg", "thumbnail.png", "cover.webp", "cover.jpg", "cover.jpeg", "cover.png"}
+
 type EPUBMetadata struct {
 	Author        string
 	Description   string
@@ -149,35 +154,7 @@ func IndexMedia(absolutePath, librarySlug string, dataBackend *store.FileStore)
 
 	// If media already exists, avoid external API calls and heavy image work.
 	// Only update the path if needed and index any new chapters.
-	// Use GetMediaUnfiltered to check globally
-	existingMedia, err = models.GetMediaUnfiltered(slug)
-	if err != nil {
-		log.Errorf("Failed to lookup media '%s': %s", slug, err)
-	}
-
-	if existingMedia != nil {
-		// Count chapters in the new path
-		var newCandidateCount int
-		if isSingleFile {
-			newCandidateCount = 1
-		} else {
-			_ = filepath.WalkDir(absolutePath, func(p string, d fs.DirEntry, walkErr error) error {
-				if walkErr != nil {
-					return nil
-				}
-				if d.IsDir() {
-					return nil
-				}
-				name := d.Name()
-				cleanedName := text.RemovePatterns(strings.TrimSuffix(name, filepath.Ext(name)))
-				if containsNumber(cleanedName) {
-					newCandidateCount++
-				}
-				return nil
-			})
-		}
-	}
-
+	// existingMedia was looked up globally via GetMediaUnfiltered above.
 	if existingMedia != nil {
 		return handleExistingMedia(existingMedia, absolutePath, librarySlug, cleanedName, slug, provider, fileInfo, isSingleFile)
 	} else {
@@ -306,9 +283,7 @@ func HandleLocalImages(slug, absolutePath string, dataBackend *store.FileStore)
 	log.Debugf("Attempting to generate poster from local images for media '%s' at path '%s'", slug, absolutePath)
 
 	// First, check for standalone poster/thumbnail images
-	imageFiles := []string{"poster.webp", "poster.jpg", "poster.jpeg", "poster.png", "thumbnail.webp", "thumbnail.jpg", "thumbnail.jpeg", "thumbnail.png", "cover.webp", "cover.jpg", "cover.jpeg", "cover.png"}
-
-	for _, filename := range imageFiles {
+	for _, filename := range StandalonePosterFiles {
 		imagePath := filepath.Join(absolutePath, filename)
 		if _, err := os.Stat(imagePath); err == nil {
 			log.Debugf("Found standalone poster image '%s' for media '%s'", filename, slug)
@@ -327,10 +302,7 @@ func HandleLocalImages(slug, absolutePath string, dataBackend *store.FileStore)
 
 	if !fileInfo.IsDir() {
 		// This is a file (likely an archive like .cbz, .cbr, .zip, .rar, .epub)
-		lowerPath := strings.ToLower(absolutePath)
-		if strings.HasSuffix(lowerPath, ".cbz") || strings.HasSuffix(lowerPath, ".cbr") ||
-			strings.HasSuffix(lowerPath, ".zip") || strings.HasSuffix(lowerPath, ".rar") ||
-			strings.HasSuffix(lowerPath, ".epub") {
+		if isPosterArchive(absolutePath) {
 			log.Debugf("Extracting poster from single archive file '%s' for media '%s'", absolutePath, slug)
 			return files.ExtractPosterImage(absolutePath, slug, dataBackend, true)
 		} else {
@@ -350,10 +322,7 @@ func HandleLocalImages(slug, absolutePath string, dataBackend *store.FileStore)
 		// First, try to extract from archive files within the directory
 		for _, entry := range entries {
 			if !entry.IsDir() {
-				lowerName := strings.ToLower(entry.Name())
-				if strings.HasSuffix(lowerName, ".cbz") || strings.HasSuffix(lowerName, ".cbr") ||
-					strings.HasSuffix(lowerName, ".zip") || strings.HasSuffix(lowerName, ".rar") ||
-					strings.HasSuffix(lowerName, ".epub") {
+				if isPosterArchive(entry.Name()) {
 					archivePath := filepath.Join(absolutePath, entry.Name())
 					log.Debugf("Extracting poster from archive '%s' in directory for media '%s'", entry.Name(), slug)
 					return files.ExtractPosterImage(archivePath, slug, dataBackend, true)
@@ -382,10 +351,7 @@ func HandleLocalImages(slug, absolutePath string, dataBackend *store.FileStore)
 				}
 				for _, chapterEntry := range chapterEntries {
 					if !chapterEntry.IsDir() {
-						lowerName := strings.ToLower(chapterEntry.Name())
-						if strings.HasSuffix(lowerName, ".jpg") || strings.HasSuffix(lowerName, ".jpeg") ||
-							strings.HasSuffix(lowerName, ".png") || strings.HasSuffix(lowerName, ".webp") ||
-							strings.HasSuffix(lowerName, ".bmp") || strings.HasSuffix(lowerName, ".gif") {
+						if isPosterImage(chapterEntry.Name()) {
 							imagePath := filepath.Join(chapterPath, chapterEntry.Name())
 							log.Debugf("Found first image '%s' in chapter directory '%s' for media '%s'", chapterEntry.Name(), dirName, slug)
 							return processLocalImage(slug, imagePath, dataBackend)
@@ -401,10 +367,7 @@ func HandleLocalImages(slug, absolutePath string, dataBackend *store.FileStore)
 			var imageFiles []string
 			for _, entry := range entries {
 				if !entry.IsDir() {
-					lowerName := strings.ToLower(entry.Name())
-					if strings.HasSuffix(lowerName, ".jpg") || strings.HasSuffix(lowerName, ".jpeg") ||
-						strings.HasSuffix(lowerName, ".png") || strings.HasSuffix(lowerName, ".webp") ||
-						strings.HasSuffix(lowerName, ".bmp") || strings.HasSuffix(lowerName, ".gif") {
+					if isPosterImage(entry.Name()) {
 						imageFiles = append(imageFiles, entry.Name())
 					}
 				}
@@ -423,6 +386,24 @@ func HandleLocalImages(slug, absolutePath string, dataBackend *store.FileStore)
 	return "", nil
 }
 
+// posterArchiveExts and posterImageExts are the lowercase extensions HandleLocalImages can take a poster from
+var (
+	posterArchiveExts = map[string]struct{}{".cbz": {}, ".cbr": {}, ".zip": {}, ".rar": {}, ".epub": {}}
+	posterImageExts   = map[string]struct{}{".jpg": {}, ".jpeg": {}, ".png": {}, ".webp": {}, ".bmp": {}, ".gif": {}}
+)
+
+// isPosterArchive reports whether name has an archive extension a poster can be extracted from
+func isPosterArchive(name string) bool {
+	_, ok := posterArchiveExts[strings.ToLower(filepath.Ext(name))]
+	return ok
+}
+
+// isPosterImage reports whether name has an image extension usable as a poster
+func isPosterImage(name string) bool {
+	_, ok := posterImageExts[strings.ToLower(filepath.Ext(name))]
+	return ok
+}
+
 func processLocalImage(slug, imagePath string, dataBackend *store.FileStore) (string, error) {
 	return files.ProcessLocalImageWithThumbnails(imagePath, slug, dataBackend, true)
 }
@@ -438,9 +419,17 @@ func DownloadAndStoreImage(slug, coverArtURL string, dataBackend *store.FileStor
 	for attempt := 1; attempt <= maxRetries; attempt++ {
 		if err := files.DownloadImageWithThumbnails(slug, coverArtURL, dataBackend, true); err != nil {
 			log.Warnf("Error downloading file from %s (attempt %d/%d): %s", coverArtURL, attempt, maxRetries, err)
+			if errors.Is(err, files.ErrImageUnavailable) {
+				// Client errors such as 404 or 410, or a response that isn't an image, won't resolve on retry
+				return coverArtURL, nil
+			}
 			if attempt < maxRetries {
-				// Wait before retrying (exponential backoff)
-				time.Sleep(time.Duration(attempt) * time.Second)
+				delay := imageRetryDelay(attempt)
+				var rateLimited *files.RateLimitError
+				if errors.As(err, &rateLimited) && rateLimited.RetryAfter > delay {
+					delay = min(rateLimited.RetryAfter, maxImageRetryAfter)
+				}
+				time.Sleep(delay)
 				continue
 			}
 			log.Errorf("Failed to download image from %s after %d attempts", coverArtURL, maxRetries)
@@ -453,6 +442,16 @@ func DownloadAndStoreImage(slug, coverArtURL string, dataBackend *store.FileStor
 	return storedImageURL, nil
 }
 
+// maxImageRetryAfter caps how long a server's Retry-After can stall an indexer worker.
+const maxImageRetryAfter = 30 * time.Second
+
+// imageRetryDelay returns an exponential backoff with jitter for the given attempt (1-based),
+// so concurrent indexer workers don't retry a rate-limited host in lockstep.
+func imageRetryDelay(attempt int) time.Duration {
+	base := time.Second << (attempt - 1)
+	return base + rand.N(base/2)
+}
+
 // IndexChapters reconciles chapter files on disk with the stored chapter records.
 // Returns added count, deleted count, new chapter slugs, and total file count.
 // If dryRun is true, only counts files without performing database operations.
@@ -618,7 +617,7 @@ func collectPresentChapters(path string, rootPath string) (map[string]presentInf
 			if !containsNumber(cleanedName) {
 				continue
 			}
-			chapterName := text.ExtractChapterName(name)
+			chapterName := text.ExtractChapterNameCleaned(name, cleanedName)
 			chapterSlug := text.Sluggify(chapterName)
 			relPath := filepath.Join(relativeMedia, name)
 			presentMap[chapterSlug] = presentInfo{Rel: relPath, Name: chapterName}
@@ -738,15 +737,18 @@ func processDeletions(tx *sql.Tx, slug string, presentMap map[string]presentInfo
 	return deletedCount, nil
 }
 
+// Pre-compiled regex for extractChapterNumber
+var chapterOrVolumeNumberRegex = regexp.MustCompile(`(?:Chapter|Volume)\s+(\d+)`)
+
 // extractChapterNumber extracts the numeric part from a chapter name
 func extractChapterNumber(chapterName string) string {
 	// Look for patterns like "Chapter 1", "Volume 1", or just "1"
-	if matches := regexp.MustCompile(`(?:Chapter|Volume)\s+(\d+)`).FindStringSubmatch(chapterName); matches != nil {
+	if matches := chapterOrVolumeNumberRegex.FindStringSubmatch(chapterName); matches != nil {
 		return matches[1]
 	}
 	// If it's just a number
-	if matches := regexp.MustCompile(`^(\d+)$`).FindStringSubmatch(chapterName); matches != nil {
-		return matches[1]
+	if text.IsDigits(chapterName) {
+		return chapterName
 	}
 	// Default to 1
 	return "1"
@@ -1171,13 +1173,93 @@ func handleNewMedia(cleanedName, slug, librarySlug, absolutePath string, _ metad
 		log.Debugf("No tags found in metadata for new media '%s'", slug)
 	}
 
-	// Synchronously generate and set poster using robust logic
+	// Look for a local poster or download the metadata cover while chapters are
+	// indexed, so the network round trip overlaps with the directory walk.
+	var posterURL string
+	var usedLocal bool
+	var posterWG sync.WaitGroup
+	posterWG.Add(1)
+	go func() {
+		defer posterWG.Done()
+		posterURL, usedLocal = loadOrDownloadPoster(slug, absolutePath, aggregatedMeta, dataBackend)
+	}()
+
+	added, deleted, newChapterSlugs, presentCount, err := IndexChapters(slug, absolutePath, librarySlug, false)
+	posterWG.Wait()
+	if err != nil {
+		log.Errorf("Failed to index chapters: %s (%s)", slug, err.Error())
+		// The media row exists, so still record a poster that was stored meanwhile
+		recordMediaCoverURL(slug, posterURL)
+		return "", err
+	}
+
+	// Update FileCount after indexing
+	if presentCount == 0 {
+		// No chapters found, delete the newly created media
+		log.Warnf("No chapters found for new media '%s', deleting", slug)
+		if err := models.DeleteMedia(slug); err != nil {
+			log.Errorf("Failed to delete empty media '%s': %s", slug, err)
+		}
+		return "", nil
+	}
+
+	// If still no poster, try extracting from archive. This runs after indexing
+	// since ComicInfo embedding may rewrite the archives during IndexChapters.
+	if !usedLocal {
+		log.Debugf("Extracting poster from archive for media '%s'", slug)
+		posterURL, err = files.ExtractPosterImage(absolutePath, slug, dataBackend, true)
+		if err != nil {
+			log.Warnf("Failed to extract poster for media '%s': %v", slug, err)
+		}
+	}
+
+	recordMediaCoverURL(slug, posterURL)
+
+	// Update only the FileCount field to avoid racing with the async cover art goroutine
+	if err := models.UpdateMediaFileCount(slug, presentCount); err != nil {
+		log.Errorf("Failed to update file count for new media '%s': %s", slug, err)
+	}
+
+	// If new chapters were added, check for users reading this media and notify them
+	if added > 0 && len(newChapterSlugs) > 0 {
+		if err := models.NotifyUsersOfNewChapters(slug, newChapterSlugs); err != nil {
+			log.Errorf("Failed to create notifications for new chapters in media '%s': %s", slug, err)
+		}
+	}
+
+	if added > 0 || deleted > 0 {
+		if aggregatedMeta == nil {
+			log.Infof("Created series: '%s' (added=%d deleted=%d, fetched from local metadata)", cleanedName, added, deleted)
+		} else {
+			log.Infof("Created series: '%s' (added=%d deleted=%d)", cleanedName, added, deleted)
+		}
+	}
+	return slug, nil
+}
+
+// recordMediaCoverURL updates the media with its cover URL if we got one.
+func recordMediaCoverURL(slug, posterURL string) {
+	if posterURL == "" {
+		log.Debugf("No cover URL found for media '%s'", slug)
+		return
+	}
+	log.Debugf("Updating media '%s' with cover URL: %s", slug, posterURL)
+	if err := models.UpdateMediaCoverArtURL(slug, posterURL); err != nil {
+		log.Errorf("Failed to update cover URL for media '%s': %s", slug, err)
+	} else {
+		log.Debugf("Successfully updated cover URL for media '%s'", slug)
+	}
+}
+
+// loadOrDownloadPoster processes a local poster file from the media directory or,
+// failing that, downloads the first metadata cover. It reports whether a poster
+// is in place; the URL is empty when the cached poster is already current.
+func loadOrDownloadPoster(slug, absolutePath string, aggregatedMeta *metadata.AggregatedMediaMetadata, dataBackend *store.FileStore) (string, bool) {
 	var posterURL string
 	var usedLocal bool
 
 	// Try local poster files in the media directory
-	posterCandidates := []string{"poster.webp", "poster.jpg", "poster.jpeg", "poster.png", "thumbnail.webp", "thumbnail.jpg", "thumbnail.jpeg", "thumbnail.png", "cover.webp", "cover.jpg", "cover.jpeg", "cover.png"}
-	for _, candidate := range posterCandidates {
+	for _, candidate := range StandalonePosterFiles {
 		posterPath := filepath.Join(absolutePath, candidate)
 		if stat, err := os.Stat(posterPath); err == nil {
 			localSize := stat.Size()
@@ -1217,63 +1299,5 @@ func handleNewMedia(cleanedName, slug, librarySlug, absolutePath string, _ metad
 		}
 	}
 
-	// If still no poster, try extracting from archive
-	if !usedLocal {
-		log.Debugf("Extracting poster from archive for media '%s'", slug)
-		posterURL, err = files.ExtractPosterImage(absolutePath, slug, dataBackend, true)
-		if err != nil {
-			log.Warnf("Failed to extract poster for media '%s': %v", slug, err)
-		} else {
-			usedLocal = true
-		}
-	}
-
-	// Update media with cover URL if we got one
-	if posterURL != "" {
-		log.Debugf("Updating media '%s' with cover URL: %s", slug, posterURL)
-		if err := models.UpdateMediaCoverArtURL(slug, posterURL); err != nil {
-			log.Errorf("Failed to update cover URL for media '%s': %s", slug, err)
-		} else {
-			log.Debugf("Successfully updated cover URL for media '%s'", slug)
-		}
-	} else {
-		log.Debugf("No cover URL found for media '%s'", slug)
-	}
-
-	added, deleted, newChapterSlugs, presentCount, err := IndexChapters(slug, absolutePath, librarySlug, false)
-	if err != nil {
-		log.Errorf("Failed to index chapters: %s (%s)", slug, err.Error())
-		return "", err
-	}
-
-	// Update FileCount after indexing
-	if presentCount == 0 {
-		// No chapters found, delete the newly created media
-		log.Warnf("No chapters found for new media '%s', deleting", slug)
-		if err := models.DeleteMedia(slug); err != nil {
-			log.Errorf("Failed to delete empty media '%s': %s", slug, err)
-		}
-		return "", nil
-	} else {
-		// Update only the FileCount field to avoid racing with the async cover art goroutine
-		if err := models.UpdateMediaFileCount(slug, presentCount); err != nil {
-			log.Errorf("Failed to update file count for new media '%s': %s", slug, err)
-		}
-	}
-
-	// If new chapters were added, check for users reading this media and notify them
-	if added > 0 && len(newChapterSlugs) > 0 {
-		if err := models.NotifyUsersOfNewChapters(slug, newChapterSlugs); err != nil {
-			log.Errorf("Failed to create notifications for new chapters in media '%s': %s", slug, err)
-		}
-	}
-
-	if added > 0 || deleted > 0 {
-		if aggregatedMeta == nil {
-			log.Infof("Created series: '%s' (added=%d deleted=%d, fetched from local metadata)", cleanedName, added, deleted)
-		} else {
-			log.Infof("Created series: '%s' (added=%d deleted=%d)", cleanedName, added, deleted)
-		}
-	}
-	return slug, nil
+	return posterURL, usedLocal
 }
@@ -5,7 +5,6 @@ import (
 	"io/fs"
 	"os"
 	"path/filepath"
-	"sort"
 	"strings"
 	"sync"
 	"time"
@@ -19,6 +18,7 @@ import (
 )
 
 type indexResult struct {
+	path string
 	err  error
 	slug string
 }
@@ -502,21 +502,11 @@ func (idx *Indexer) processFolder(folder string) error {
 		return fmt.Errorf("folder not configured for this library: %s", folder)
 	}
 
-	dir, err := os.Open(folder)
+	// os.ReadDir returns entries sorted by name without an lstat per entry
+	entries, err := os.ReadDir(folder)
 	if err != nil {
 		return err
 	}
-	defer dir.Close()
-
-	entries, err := dir.Readdir(-1)
-	if err != nil {
-		return err
-	}
-
-	// Sort entries alphabetically by name
-	sort.Slice(entries, func(i, j int) bool {
-		return entries[i].Name() < entries[j].Name()
-	})
 
 	// Collect media paths for concurrent processing
 	var mediaPaths []string
@@ -538,8 +528,9 @@ func (idx *Indexer) processFolder(folder string) error {
 		}
 	}
 
-	// Process media concurrently with worker pool
-	const numWorkers = 4
+	// Process media concurrently with a bounded worker pool
+	const maxWorkers = 4
+	numWorkers := min(maxWorkers, len(mediaPaths))
 	jobs := make(chan string, len(mediaPaths))
 	results := make(chan indexResult, len(mediaPaths))
 
@@ -547,10 +538,11 @@ func (idx *Indexer) processFolder(folder string) error {
 	for range numWorkers {
 		go func() {
 			for path := range jobs {
+				// Once stopped, drain remaining jobs so the collector still gets one result per path
 				select {
 				case <-idx.stop:
-					results <- indexResult{err: nil, slug: ""}
-					return
+					results <- indexResult{path: path}
+					continue
 				default:
 				}
 
@@ -562,7 +554,7 @@ func (idx *Indexer) processFolder(folder string) error {
 				// Scanning media - don't log to avoid spam
 
 				slug, err := IndexMediaFunc(path, idx.Library.Slug, idx.dataBackend)
-				results <- indexResult{err: err, slug: slug}
+				results <- indexResult{path: path, err: err, slug: slug}
 			}
 		}()
 	}
@@ -578,13 +570,19 @@ func (idx *Indexer) processFolder(folder string) error {
 	for i := 0; i < len(mediaPaths); i++ {
 		result := <-results
 		if result.err != nil {
-			path := mediaPaths[i]
-			log.Errorf("Error indexing media at '%s': %s", path, result.err)
+			log.Errorf("Error indexing media at '%s': %s", result.path, result.err)
 		} else if result.slug != "" {
 			processedSlugs[result.slug] = true
 		}
 	}
 
+	// An interrupted scan hasn't seen every media, so skip orphan cleanup
+	select {
+	case <-idx.stop:
+		return nil
+	default:
+	}
+
 	// Clean up media that no longer exist on disk
 	if err := cleanupOrphanedMedia(idx.Library.Slug, processedSlugs, idx.dataBackend); err != nil {
 		log.Errorf("Error cleaning up orphaned media for library '%s': %s", idx.Library.Slug, err)
@@ -595,9 +593,9 @@ func (idx *Indexer) processFolder(folder string) error {
 
 // cleanupOrphanedMedia removes media that have chapters in this library but no longer exist on disk
 func cleanupOrphanedMedia(librarySlug string, processedSlugs map[string]bool, dataBackend *store.FileStore) error {
-	// Get all chapters for this library
+	// Get the distinct media with chapters in this library
 	query := `
-	SELECT c.media_slug
+	SELECT DISTINCT c.media_slug
 	FROM chapters c
 	WHERE c.library_slug = ?
 	`
@@ -135,8 +135,7 @@ func (a *AniListProvider) findMangaOnAniList(mediaSlug string) (int, error) {
 	req.Header.Set("Content-Type", "application/json")
 	req.Header.Set("Accept", "application/json")
 
-	client := &http.Client{}
-	resp, err := client.Do(req)
+	resp, err := httpClient.Do(req)
 	if err != nil {
 		return 0, err
 	}
@@ -201,8 +200,7 @@ func (a *AniListProvider) updateProgress(accessToken string, mangaID int, chapte
 	req.Header.Set("Content-Type", "application/json")
 	req.Header.Set("Accept", "application/json")
 
-	client := &http.Client{}
-	resp, err := client.Do(req)
+	resp, err := httpClient.Do(req)
 	if err != nil {
 		log.Errorf("AniList updateProgress: request error: %v", err)
 		return err
@@ -90,8 +90,7 @@ func (m *MALProvider) findMangaOnMAL(mediaSlug string) (int, error) {
 	}
 	req.Header.Set("Authorization", "Bearer "+m.apiToken)
 
-	client := &http.Client{}
-	resp, err := client.Do(req)
+	resp, err := httpClient.Do(req)
 	if err != nil {
 		return 0, err
 	}
@@ -144,8 +143,7 @@ func (m *MALProvider) updateStatusOnly(mangaID int) error {
 	req.Header.Set("Authorization", "Bearer "+m.apiToken)
 	req.Header.Set("Content-Type", "application/json")
 
-	client := &http.Client{}
-	resp, err := client.Do(req)
+	resp, err := httpClient.Do(req)
 	if err != nil {
 		log.Errorf("MAL updateStatusOnly: do error: %v", err)
 		return err
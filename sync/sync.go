@@ -2,9 +2,11 @@ package sync
 
 import (
 	"fmt"
+	"net/http"
 	"regexp"
 	"strconv"
 	"strings"
+	"time"
 
 	"github.com/alexander-bruun/magi/models"
 	"github.com/gofiber/fiber/v3/log"
@@ -18,6 +20,9 @@ type SyncProvider interface {
 	SyncReadingProgress(userName string, mediaSlug string, librarySlug string, chapterSlug string) error
 }
 
+// httpClient is shared by all sync providers so keep-alive connections to each service are reused
+var httpClient = &http.Client{Timeout: 30 * time.Second}
+
 // providers map
 var providers = make(map[string]func(string) SyncProvider)
 
@@ -94,17 +99,16 @@ func parseChapterNumber(chapterSlug string) (int, error) {
 	return strconv.Atoi(parts[len(parts)-1])
 }
 
+// volumePatterns match volume markers like "Vol. X", "Volume X", "V X", in priority order
+var volumePatterns = []*regexp.Regexp{
+	regexp.MustCompile(`Vol\. (\d+)`),
+	regexp.MustCompile(`Volume (\d+)`),
+	regexp.MustCompile(`V (\d+)`),
+}
+
 func parseVolumeNumber(chapterName string) (int, error) {
 	// Try to parse volume from chapter name, e.g. "Vol. 1 Ch. 5" or "Volume 1 Chapter 5"
-	// Look for patterns like "Vol. X", "Volume X", "V X"
-	patterns := []string{
-		`Vol\. (\d+)`,
-		`Volume (\d+)`,
-		`V (\d+)`,
-	}
-
-	for _, pattern := range patterns {
-		re := regexp.MustCompile(pattern)
+	for _, re := range volumePatterns {
 		matches := re.FindStringSubmatch(chapterName)
 		if len(matches) > 1 {
 			return strconv.Atoi(matches[1])
@@ -2,7 +2,10 @@ package email
 
 import (
 	"bufio"
+	"bytes"
+	"io"
 	"net/http"
+	"os"
 	"strings"
 	"sync"
 	"time"
@@ -12,46 +15,104 @@ import (
 
 const blocklistURL = "https://raw.githubusercontent.com/disposable-email-domains/disposable-email-domains/main/disposable_email_blocklist.conf"
 
+// blocklistCacheTTL is how long an on-disk copy of the blocklist is reused before refetching.
+const blocklistCacheTTL = 24 * time.Hour
+
 var (
 	blockedDomains map[string]struct{}
 	once           sync.Once
 )
 
-// InitBlocklist fetches the disposable email domain blocklist and caches it.
-// Safe to call multiple times; only the first call performs the fetch.
-func InitBlocklist() {
+// InitBlocklist loads the disposable email domain blocklist and caches it.
+// A fresh copy at cachePath is used as-is; otherwise the list is fetched and written
+// to cachePath, falling back to a stale copy if the fetch fails. An empty cachePath
+// disables the on-disk cache.
+// Safe to call multiple times; only the first call performs the load.
+func InitBlocklist(cachePath string) {
 	once.Do(func() {
-		blockedDomains = make(map[string]struct{})
+		if cachePath != "" {
+			if info, err := os.Stat(cachePath); err == nil && time.Since(info.ModTime()) < blocklistCacheTTL {
+				if loadBlocklistFile(cachePath) {
+					return
+				}
+			}
+		}
 
-		client := &http.Client{Timeout: 15 * time.Second}
-		resp, err := client.Get(blocklistURL)
-		if err != nil {
-			log.Warnf("Failed to fetch disposable email blocklist: %v", err)
+		if fetchBlocklist(cachePath) {
 			return
 		}
-		defer resp.Body.Close()
 
-		if resp.StatusCode != http.StatusOK {
-			log.Warnf("Disposable email blocklist returned status %d", resp.StatusCode)
+		if cachePath != "" && loadBlocklistFile(cachePath) {
+			log.Debugf("Using stale disposable email blocklist from %s", cachePath)
 			return
 		}
 
-		scanner := bufio.NewScanner(resp.Body)
-		count := 0
-		for scanner.Scan() {
-			domain := strings.TrimSpace(scanner.Text())
-			if domain != "" && !strings.HasPrefix(domain, "#") {
-				blockedDomains[strings.ToLower(domain)] = struct{}{}
-				count++
-			}
-		}
+		blockedDomains = make(map[string]struct{})
+	})
+}
+
+// fetchBlocklist downloads the blocklist and writes a copy to cachePath. Returns true on success.
+func fetchBlocklist(cachePath string) bool {
+	client := &http.Client{Timeout: 15 * time.Second}
+	resp, err := client.Get(blocklistURL)
+	if err != nil {
+		log.Warnf("Failed to fetch disposable email blocklist: %v", err)
+		return false
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode != http.StatusOK {
+		log.Warnf("Disposable email blocklist returned status %d", resp.StatusCode)
+		return false
+	}
+
+	var raw bytes.Buffer
+	domains, err := parseBlocklist(io.TeeReader(resp.Body, &raw))
+	if err != nil {
+		log.Warnf("Error reading disposable email blocklist: %v", err)
+		return false
+	}
+	blockedDomains = domains
 
-		if err := scanner.Err(); err != nil {
-			log.Warnf("Error reading disposable email blocklist: %v", err)
+	if cachePath != "" {
+		if err := os.WriteFile(cachePath, raw.Bytes(), 0644); err != nil {
+			log.Warnf("Failed to cache disposable email blocklist: %v", err)
 		}
+	}
 
-		log.Debugf("Loaded %d disposable email domains into blocklist", count)
-	})
+	log.Debugf("Loaded %d disposable email domains into blocklist", len(domains))
+	return true
+}
+
+// loadBlocklistFile loads the blocklist from a cached copy on disk. Returns true on success.
+func loadBlocklistFile(path string) bool {
+	f, err := os.Open(path)
+	if err != nil {
+		return false
+	}
+	defer f.Close()
+
+	domains, err := parseBlocklist(f)
+	if err != nil || len(domains) == 0 {
+		return false
+	}
+	blockedDomains = domains
+
+	log.Debugf("Loaded %d disposable email domains from %s", len(domains), path)
+	return true
+}
+
+// parseBlocklist reads one domain per line, skipping blanks and comments.
+func parseBlocklist(r io.Reader) (map[string]struct{}, error) {
+	domains := make(map[string]struct{})
+	scanner := bufio.NewScanner(r)
+	for scanner.Scan() {
+		domain := strings.TrimSpace(scanner.Text())
+		if domain != "" && !strings.HasPrefix(domain, "#") {
+			domains[strings.ToLower(domain)] = struct{}{}
+		}
+	}
+	return domains, scanner.Err()
 }
 
 // IsDisposableEmail checks whether the given email address uses a disposable domain.
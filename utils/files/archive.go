@@ -656,6 +656,23 @@ func GetImageDataURIByIndex(mangaPath string, imageIndex int) (string, error) {
 	return "", fmt.Errorf("unsupported file type")
 }
 
+// imageMimeTypes maps lowercase image extensions to their MIME types
+var imageMimeTypes = map[string]string{
+	".jpg":  "image/jpeg",
+	".jpeg": "image/jpeg",
+	".png":  "image/png",
+	".gif":  "image/gif",
+	".webp": "image/webp",
+}
+
+// imageMimeType returns the MIME type for an image file name, defaulting to image/jpeg
+func imageMimeType(name string) string {
+	if mimeType, ok := imageMimeTypes[strings.ToLower(filepath.Ext(name))]; ok {
+		return mimeType
+	}
+	return "image/jpeg"
+}
+
 // imageFileToDataURI reads an image file and encodes it as a data URI
 func imageFileToDataURI(imagePath string) (string, error) {
 	data, err := os.ReadFile(imagePath)
@@ -663,21 +680,38 @@ func imageFileToDataURI(imagePath string) (string, error) {
 		return "", err
 	}
 
-	ext := strings.ToLower(filepath.Ext(imagePath))
-	mimeType := "image/jpeg"
-	switch ext {
-	case ".png":
-		mimeType = "image/png"
-	case ".gif":
-		mimeType = "image/gif"
-	case ".webp":
-		mimeType = "image/webp"
-	}
+	mimeType := imageMimeType(imagePath)
 
 	encoded := base64.StdEncoding.EncodeToString(data)
 	return fmt.Sprintf("data:%s;base64,%s", mimeType, encoded), nil
 }
 
+// maxDataURIPrealloc caps how much of an archive entry's declared size
+// readerToDataURI trusts up front, matching the handlers' maxZipPrealloc.
+const maxDataURIPrealloc = 64 << 20
+
+// readerToDataURI base64-encodes r straight into a data URI, avoiding separate
+// copies of the raw bytes and the encoded string. size is the decoded length
+// if known, or <= 0 otherwise.
+func readerToDataURI(r io.Reader, mimeType string, size int64) (string, error) {
+	prefix := "data:" + mimeType + ";base64,"
+	var sb strings.Builder
+	if size > 0 {
+		// The size comes from the archive header, so only trust it up to a cap
+		sb.Grow(len(prefix) + base64.StdEncoding.EncodedLen(int(min(size, maxDataURIPrealloc))))
+	}
+	sb.WriteString(prefix)
+
+	enc := base64.NewEncoder(base64.StdEncoding, &sb)
+	if _, err := io.Copy(enc, r); err != nil {
+		return "", err
+	}
+	if err := enc.Close(); err != nil {
+		return "", err
+	}
+	return sb.String(), nil
+}
+
 // getImageFromZipAsDataURI extracts an image from a zip archive and returns as data URI
 func getImageFromZipAsDataURI(zipPath string, imageIndex int) (string, error) {
 	reader, err := zip.OpenReader(zipPath)
@@ -697,24 +731,7 @@ func getImageFromZipAsDataURI(zipPath string, imageIndex int) (string, error) {
 				}
 				defer src.Close()
 
-				data, err := io.ReadAll(src)
-				if err != nil {
-					return "", err
-				}
-
-				ext := strings.ToLower(filepath.Ext(file.Name))
-				mimeType := "image/jpeg"
-				switch ext {
-				case ".png":
-					mimeType = "image/png"
-				case ".gif":
-					mimeType = "image/gif"
-				case ".webp":
-					mimeType = "image/webp"
-				}
-
-				encoded := base64.StdEncoding.EncodeToString(data)
-				return fmt.Sprintf("data:%s;base64,%s", mimeType, encoded), nil
+				return readerToDataURI(src, imageMimeType(file.Name), int64(file.UncompressedSize64))
 			}
 			imageCount++
 		}
@@ -746,24 +763,7 @@ func getImageFromRarAsDataURI(rarPath string, imageIndex int) (string, error) {
 		}
 		if isImageFile(header.Name) {
 			if imageCount == imageIndex {
-				data, err := io.ReadAll(reader)
-				if err != nil {
-					return "", err
-				}
-
-				ext := strings.ToLower(filepath.Ext(header.Name))
-				mimeType := "image/jpeg"
-				switch ext {
-				case ".png":
-					mimeType = "image/png"
-				case ".gif":
-					mimeType = "image/gif"
-				case ".webp":
-					mimeType = "image/webp"
-				}
-
-				encoded := base64.StdEncoding.EncodeToString(data)
-				return fmt.Sprintf("data:%s;base64,%s", mimeType, encoded), nil
+				return readerToDataURI(reader, imageMimeType(header.Name), header.UnPackedSize)
 			}
 			imageCount++
 		}
@@ -1043,40 +1043,30 @@ func AddComicInfoToCBZ(cbzPath string, comicInfoXML []byte) error {
 	}
 	defer reader.Close()
 
-	// Create the new CBZ file
+	// Create the new CBZ file; it only replaces the original once fully written
 	newFile, err := os.Create(tempPath)
 	if err != nil {
 		return fmt.Errorf("failed to create temporary file: %w", err)
 	}
-	defer newFile.Close()
+	replaced := false
+	defer func() {
+		if !replaced {
+			newFile.Close()
+			os.Remove(tempPath)
+		}
+	}()
 
 	zipWriter := zip.NewWriter(newFile)
-	defer zipWriter.Close()
 
-	// Copy all existing files
+	// Copy all existing files. Copy moves the raw compressed bytes across, so
+	// pages are neither inflated nor recompressed.
 	for _, file := range reader.File {
 		// Skip existing ComicInfo.xml if present
 		if strings.EqualFold(file.Name, "ComicInfo.xml") {
 			continue
 		}
 
-		// Open the file from the existing archive
-		rc, err := file.Open()
-		if err != nil {
-			return fmt.Errorf("failed to open file %s: %w", file.Name, err)
-		}
-
-		// Create the file in the new archive
-		newFile, err := zipWriter.Create(file.Name)
-		if err != nil {
-			rc.Close()
-			return fmt.Errorf("failed to create file %s: %w", file.Name, err)
-		}
-
-		// Copy the content
-		_, err = io.Copy(newFile, rc)
-		rc.Close()
-		if err != nil {
+		if err := zipWriter.Copy(file); err != nil {
 			return fmt.Errorf("failed to copy file %s: %w", file.Name, err)
 		}
 	}
@@ -1092,17 +1082,19 @@ func AddComicInfoToCBZ(cbzPath string, comicInfoXML []byte) error {
 		return fmt.Errorf("failed to write ComicInfo.xml: %w", err)
 	}
 
-	// Close the writers
-	zipWriter.Close()
-	newFile.Close()
+	// Close the writers; a failed close means the archive is incomplete
+	if err := zipWriter.Close(); err != nil {
+		return fmt.Errorf("failed to close ZIP writer: %w", err)
+	}
+	if err := newFile.Close(); err != nil {
+		return fmt.Errorf("failed to close temporary file: %w", err)
+	}
 
 	// Replace the original file
-	err = os.Rename(tempPath, cbzPath)
-	if err != nil {
-		// Clean up temp file
-		os.Remove(tempPath)
+	if err := os.Rename(tempPath, cbzPath); err != nil {
 		return fmt.Errorf("failed to replace original CBZ: %w", err)
 	}
+	replaced = true
 
 	log.Debugf("Added ComicInfo.xml to CBZ: %s", cbzPath)
 	return nil
@@ -1134,11 +1126,16 @@ func AddComicInfoToCBR(cbrPath string, comicInfoXML []byte) error {
 	if err != nil {
 		return fmt.Errorf("failed to create temporary CBZ file: %w", err)
 	}
-	defer cbzFile.Close()
+	replaced := false
+	defer func() {
+		if !replaced {
+			cbzFile.Close()
+			os.Remove(tempCbzPath)
+		}
+	}()
 
 	// Create ZIP writer
 	zipWriter := zip.NewWriter(cbzFile)
-	defer zipWriter.Close()
 
 	// Extract files from CBR and add to CBZ
 	for {
@@ -1155,10 +1152,16 @@ func AddComicInfoToCBR(cbrPath string, comicInfoXML []byte) error {
 			continue
 		}
 
+		// Images are already compressed, so store them as-is rather than deflating again
+		method := zip.Deflate
+		if isImageFile(header.Name) {
+			method = zip.Store
+		}
+
 		// Create ZIP file header
 		zipHeader := &zip.FileHeader{
 			Name:   header.Name,
-			Method: zip.Deflate,
+			Method: method,
 		}
 		zipHeader.SetModTime(header.ModificationTime)
 
@@ -1203,9 +1206,9 @@ func AddComicInfoToCBR(cbrPath string, comicInfoXML []byte) error {
 	// Replace original CBR with new CBZ (change extension)
 	newCbzPath := strings.TrimSuffix(cbrPath, filepath.Ext(cbrPath)) + ".cbz"
 	if err := os.Rename(tempCbzPath, newCbzPath); err != nil {
-		os.Remove(tempCbzPath)
 		return fmt.Errorf("failed to rename CBZ file: %w", err)
 	}
+	replaced = true
 
 	// Remove original CBR file
 	if err := os.Remove(cbrPath); err != nil {
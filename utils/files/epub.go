@@ -59,6 +59,16 @@ type NCX struct {
 	} `xml:"navMap"`
 }
 
+// decodeZipXML decodes an XML document straight from an archive entry without buffering it.
+func decodeZipXML(f *zip.File, v any) error {
+	rc, err := f.Open()
+	if err != nil {
+		return err
+	}
+	defer rc.Close()
+	return xml.NewDecoder(rc).Decode(v)
+}
+
 // GetChapters extracts chapter information from an EPUB file
 func GetChapters(epubPath string) ([]Chapter, error) {
 	r, err := zip.OpenReader(epubPath)
@@ -79,18 +89,8 @@ func GetChapters(epubPath string) ([]Chapter, error) {
 		return nil, fmt.Errorf("container.xml not found")
 	}
 
-	rc, err := containerFile.Open()
-	if err != nil {
-		return nil, err
-	}
-	defer rc.Close()
-	containerData, err := io.ReadAll(rc)
-	if err != nil {
-		return nil, err
-	}
-
 	var container Container
-	err = xml.Unmarshal(containerData, &container)
+	err = decodeZipXML(containerFile, &container)
 	if err != nil {
 		return nil, err
 	}
@@ -109,18 +109,8 @@ func GetChapters(epubPath string) ([]Chapter, error) {
 		return nil, fmt.Errorf("OPF file not found: %s", opfPath)
 	}
 
-	rc2, err := opfFile.Open()
-	if err != nil {
-		return nil, err
-	}
-	defer rc2.Close()
-	opfData, err := io.ReadAll(rc2)
-	if err != nil {
-		return nil, err
-	}
-
 	var pkg Package
-	err = xml.Unmarshal(opfData, &pkg)
+	err = decodeZipXML(opfFile, &pkg)
 	if err != nil {
 		return nil, err
 	}
@@ -166,18 +156,8 @@ func GetOPFDir(epubPath string) (string, error) {
 		return "", fmt.Errorf("container.xml not found")
 	}
 
-	rc, err := containerFile.Open()
-	if err != nil {
-		return "", err
-	}
-	defer rc.Close()
-	containerData, err := io.ReadAll(rc)
-	if err != nil {
-		return "", err
-	}
-
 	var container Container
-	err = xml.Unmarshal(containerData, &container)
+	err = decodeZipXML(containerFile, &container)
 	if err != nil {
 		return "", err
 	}
@@ -208,18 +188,8 @@ func GetTitlesFromNCX(epubPath string) (map[string]string, error) {
 		return nil, fmt.Errorf("container.xml not found")
 	}
 
-	rc, err := containerFile.Open()
-	if err != nil {
-		return nil, err
-	}
-	defer rc.Close()
-	containerData, err := io.ReadAll(rc)
-	if err != nil {
-		return nil, err
-	}
-
 	var container Container
-	err = xml.Unmarshal(containerData, &container)
+	err = decodeZipXML(containerFile, &container)
 	if err != nil {
 		return nil, err
 	}
@@ -238,18 +208,8 @@ func GetTitlesFromNCX(epubPath string) (map[string]string, error) {
 		return nil, fmt.Errorf("OPF file not found: %s", opfPath)
 	}
 
-	rc2, err := opfFile.Open()
-	if err != nil {
-		return nil, err
-	}
-	defer rc2.Close()
-	opfData, err := io.ReadAll(rc2)
-	if err != nil {
-		return nil, err
-	}
-
 	var pkg Package
-	err = xml.Unmarshal(opfData, &pkg)
+	err = decodeZipXML(opfFile, &pkg)
 	if err != nil {
 		return nil, err
 	}
@@ -281,18 +241,8 @@ func GetTitlesFromNCX(epubPath string) (map[string]string, error) {
 		return nil, fmt.Errorf("NCX file not found: %s", ncxPath)
 	}
 
-	rc3, err := ncxFile.Open()
-	if err != nil {
-		return nil, err
-	}
-	defer rc3.Close()
-	ncxData, err := io.ReadAll(rc3)
-	if err != nil {
-		return nil, err
-	}
-
 	var ncx NCX
-	err = xml.Unmarshal(ncxData, &ncx)
+	err = decodeZipXML(ncxFile, &ncx)
 	if err != nil {
 		return nil, err
 	}
@@ -307,17 +257,61 @@ func GetTitlesFromNCX(epubPath string) (map[string]string, error) {
 
 // ExtractTitle extracts title from HTML content
 func ExtractTitle(html string) string {
-	re := regexp.MustCompile(`(?i)<h1[^>]*>(.*?)</h1>`)
-	if match := re.FindStringSubmatch(html); len(match) > 1 {
-		return strings.TrimSpace(match[1])
+	if title, ok := tagText(html, "h1"); ok {
+		return strings.TrimSpace(title)
 	}
-	re2 := regexp.MustCompile(`(?i)<title[^>]*>(.*?)</title>`)
-	if match := re2.FindStringSubmatch(html); len(match) > 1 {
-		return strings.TrimSpace(match[1])
+	if title, ok := tagText(html, "title"); ok {
+		return strings.TrimSpace(title)
 	}
 	return "Untitled"
 }
 
+// tagText returns the content between the first <tag ...> and the following </tag>,
+// matching tag names case-insensitively. It scans for the literal delimiters rather
+// than running a lazy regex over the whole document.
+func tagText(html, tag string) (string, bool) {
+	open := indexTagFold(html, "<"+tag)
+	if open < 0 {
+		return "", false
+	}
+	start := open + len(tag) + 1
+	gt := strings.IndexByte(html[start:], '>')
+	if gt < 0 {
+		return "", false
+	}
+	start += gt + 1
+	end := indexTagFold(html[start:], "</"+tag+">")
+	if end < 0 {
+		return "", false
+	}
+	return html[start : start+end], true
+}
+
+// indexTagFold finds tag (which starts with '<') in s, ignoring ASCII case.
+func indexTagFold(s, tag string) int {
+	for i := 0; ; i++ {
+		j := strings.IndexByte(s[i:], '<')
+		if j < 0 {
+			return -1
+		}
+		i += j
+		if len(s)-i < len(tag) {
+			return -1
+		}
+		if strings.EqualFold(s[i:i+len(tag)], tag) {
+			return i
+		}
+	}
+}
+
+// Pre-compiled regexes for rewriting the EPUB navigation document
+var (
+	tocEpubTypeAttrRegex = regexp.MustCompile(`\s+epub:type="[^"]*"`)
+	tocIDAttrRegex       = regexp.MustCompile(`\s+id="[^"]*"`)
+	tocHrefRegex         = regexp.MustCompile(`href="[^"]*"`)
+	tocInvalidEntryRegex = regexp.MustCompile(`<li[^>]*><a href="#(chapter-[^"]*)">[^<]*</a></li>`)
+)
+
 // GetTOC generates table of contents HTML from EPUB
 func GetTOC(epubPath string) string {
 	r, err := zip.OpenReader(epubPath)
@@ -338,18 +332,8 @@ func GetTOC(epubPath string) string {
 		return "container.xml not found"
 	}
 
-	rc, err := containerFile.Open()
-	if err != nil {
-		return err.Error()
-	}
-	defer rc.Close()
-	containerData, err := io.ReadAll(rc)
-	if err != nil {
-		return err.Error()
-	}
-
 	var container Container
-	err = xml.Unmarshal(containerData, &container)
+	err = decodeZipXML(containerFile, &container)
 	if err != nil {
 		return err.Error()
 	}
@@ -368,18 +352,8 @@ func GetTOC(epubPath string) string {
 		return "OPF file not found: " + opfPath
 	}
 
-	rc2, err := opfFile.Open()
-	if err != nil {
-		return err.Error()
-	}
-	defer rc2.Close()
-	opfData, err := io.ReadAll(rc2)
-	if err != nil {
-		return err.Error()
-	}
-
 	var pkg Package
-	err = xml.Unmarshal(opfData, &pkg)
+	err = decodeZipXML(opfFile, &pkg)
 	if err != nil {
 		return err.Error()
 	}
@@ -462,26 +436,21 @@ func GetTOC(epubPath string) string {
 	}
 
 	// Strip epub attributes to prevent layout issues
-	navContent = regexp.MustCompile(`\s+epub:type="[^"]*"`).ReplaceAllString(navContent, "")
-	navContent = regexp.MustCompile(`\s+id="[^"]*"`).ReplaceAllString(navContent, "")
+	navContent = tocEpubTypeAttrRegex.ReplaceAllString(navContent, "")
+	navContent = tocIDAttrRegex.ReplaceAllString(navContent, "")
 
 	// Replace href="file" with href="#chapter-resolved-path"
-	reHref := regexp.MustCompile(`href="([^"]*)"`)
-	navContent = reHref.ReplaceAllStringFunc(navContent, func(match string) string {
-		sub := reHref.FindStringSubmatch(match)
-		if len(sub) < 2 {
-			return match
-		}
-		href := sub[1]
+	navContent = tocHrefRegex.ReplaceAllStringFunc(navContent, func(match string) string {
+		// match is always href="..." so the value can be sliced out directly
+		href := match[len(`href="`) : len(match)-1]
 		resolved := filepath.Join(tocDir, href)
 		resolved = filepath.Clean(resolved)
 		return fmt.Sprintf(`href="#chapter-%s"`, resolved)
 	})
 
 	// Remove li with invalid anchors
-	reInvalid := regexp.MustCompile(`<li[^>]*><a href="#(chapter-[^"]*)">[^<]*</a></li>`)
-	navContent = reInvalid.ReplaceAllStringFunc(navContent, func(match string) string {
-		sub := reInvalid.FindStringSubmatch(match)
+	navContent = tocInvalidEntryRegex.ReplaceAllStringFunc(navContent, func(match string) string {
+		sub := tocInvalidEntryRegex.FindStringSubmatch(match)
 		if len(sub) > 1 {
 			id := sub[1]
 			if validIds[id] {
@@ -538,19 +507,9 @@ func GetBookContent(epubPath, mangaSlug, librarySlug, chapterSlug string) string
 	if opfPath == "" {
 		for _, f := range r.File {
 			if f.Name == "META-INF/container.xml" {
-				rc, err := f.Open()
-				if err != nil {
-					return "Error reading container: " + err.Error()
-				}
-				data, err := io.ReadAll(rc)
-				rc.Close()
-				if err != nil {
-					return "Error reading container: " + err.Error()
-				}
 				var container Container
-				err = xml.Unmarshal(data, &container)
-				if err != nil {
-					return "Error parsing container: " + err.Error()
+				if err := decodeZipXML(f, &container); err != nil {
+					return "Error reading container: " + err.Error()
 				}
 				opfPath = container.Rootfiles.Rootfile.FullPath
 				break
@@ -559,6 +518,14 @@ func GetBookContent(epubPath, mangaSlug, librarySlug, chapterSlug string) string
 	}
 	opfDir := filepath.Dir(opfPath)
 
+	// Index archive entries by name so each chapter lookup is constant time
+	filesByName := make(map[string]*zip.File, len(r.File))
+	for _, f := range r.File {
+		if _, ok := filesByName[f.Name]; !ok {
+			filesByName[f.Name] = f
+		}
+	}
+
 	var content strings.Builder
 	for i, chapter := range chapters {
 		// Skip table of contents chapters
@@ -568,13 +535,7 @@ func GetBookContent(epubPath, mangaSlug, librarySlug, chapterSlug string) string
 		}
 
 		// Find the chapter file
-		var chapterFile *zip.File
-		for _, f := range r.File {
-			if f.Name == chapter.Path {
-				chapterFile = f
-				break
-			}
-		}
+		chapterFile := filesByName[chapter.Path]
 		if chapterFile == nil {
 			continue
 		}
@@ -609,63 +570,102 @@ func GetBookContent(epubPath, mangaSlug, librarySlug, chapterSlug string) string
 
 // cleanHTMLContent performs basic cleaning of HTML content from EPUB
 func cleanHTMLContent(html, mangaSlug, librarySlug, chapterSlug, chapterPath, opfDir string) string {
-	// Remove DOCTYPE, html, head, body tags
-	html = strings.ReplaceAll(html, "<!DOCTYPE html>", "")
-	html = strings.ReplaceAll(html, "<html>", "")
-	html = strings.ReplaceAll(html, "</html>", "")
-	html = strings.ReplaceAll(html, "<head>", "")
-	html = strings.ReplaceAll(html, "</head>", "")
-	html = strings.ReplaceAll(html, "<body>", "")
-	html = strings.ReplaceAll(html, "</body>", "")
-
-	// Remove script and style tags
-	for strings.Contains(html, "<script") {
-		start := strings.Index(html, "<script")
-		end := strings.Index(html[start:], "</script>")
-		if end == -1 {
-			break
+	html = stripDocumentMarkup(html)
+
+	// Rewrite img src attributes to point to asset endpoint
+	html = rewriteAssetSources(html, mangaSlug, librarySlug, chapterSlug, chapterPath, opfDir)
+	return html
+}
+
+// documentWrapperTags are removed so chapters can be embedded in the reader page.
+var documentWrapperTags = []string{"<!DOCTYPE html>", "<html>", "</html>", "<head>", "</head>", "<body>", "</body>"}
+
+// stripDocumentMarkup removes the DOCTYPE, html, head and body tags, script and
+// style elements, and link and meta tags in a single forward pass over the chapter.
+func stripDocumentMarkup(html string) string {
+	var b strings.Builder
+	b.Grow(len(html))
+
+	for {
+		i := strings.IndexByte(html, '<')
+		if i < 0 {
+			b.WriteString(html)
+			return b.String()
 		}
-		html = html[:start] + html[start+end+9:]
-	}
+		b.WriteString(html[:i])
+		rest := html[i:]
 
-	for strings.Contains(html, "<style") {
-		start := strings.Index(html, "<style")
-		end := strings.Index(html[start:], "</style>")
-		if end == -1 {
-			break
+		// Elements removed along with their content
+		if end, ok := elementEnd(rest, "<script", "</script>"); ok {
+			html = rest[end:]
+			continue
+		}
+		if end, ok := elementEnd(rest, "<style", "</style>"); ok {
+			html = rest[end:]
+			continue
 		}
-		html = html[:start] + html[start+end+8:]
-	}
 
-	// Remove link and meta tags
-	for strings.Contains(html, "<link") {
-		start := strings.Index(html, "<link")
-		end := strings.Index(html[start:], ">")
-		if end == -1 {
-			break
+		// Void tags removed up to their closing bracket
+		if strings.HasPrefix(rest, "<link") || strings.HasPrefix(rest, "<meta") {
+			if end := strings.IndexByte(rest, '>'); end != -1 {
+				html = rest[end+1:]
+				continue
+			}
 		}
-		html = html[:start] + html[start+end+1:]
-	}
 
-	for strings.Contains(html, "<meta") {
-		start := strings.Index(html, "<meta")
-		end := strings.Index(html[start:], ">")
-		if end == -1 {
-			break
+		skipped := false
+		for _, tag := range documentWrapperTags {
+			if strings.HasPrefix(rest, tag) {
+				html = rest[len(tag):]
+				skipped = true
+				break
+			}
+		}
+		if !skipped {
+			b.WriteByte('<')
+			html = rest[1:]
 		}
-		html = html[:start] + html[start+end+1:]
 	}
+}
 
-	// Rewrite img src attributes to point to asset endpoint
-	html = rewriteAssetSources(html, mangaSlug, librarySlug, chapterSlug, chapterPath, opfDir)
-	return html
+// elementEnd reports the offset just past closeTag when s starts with openTag.
+func elementEnd(s, openTag, closeTag string) (int, bool) {
+	if !strings.HasPrefix(s, openTag) {
+		return 0, false
+	}
+	end := strings.Index(s, closeTag)
+	if end == -1 {
+		return 0, false
+	}
+	return end + len(closeTag), true
 }
 
+// Pre-compiled regexes for rewriteAssetSources
+var (
+	imgSrcRegex     = regexp.MustCompile(`<img[^>]*src=(["']?)([^"'\s>]+)[^>]*>`)
+	linkHrefRegex   = regexp.MustCompile(`<link[^>]*href=(["']?)([^"'\s>]+)[^>]*>`)
+	anchorHrefRegex = regexp.MustCompile(`<a[^>]*href=(["']?)([^"'\s>]+)[^>]*>`)
+)
+
 // rewriteAssetSources rewrites img src and link href attributes to point to the asset endpoint with direct URLs
 func rewriteAssetSources(html, mangaSlug, librarySlug, chapterSlug, chapterPath, opfDir string) string {
+	chapterDir := filepath.Dir(chapterPath)
+
+	// Assets such as stylesheets and repeated images are often referenced several times;
+	// cache their URLs so each asset slug is generated once per chapter.
+	assetURLs := make(map[string]string)
+	assetURL := func(cleanPath string) string {
+		if u, ok := assetURLs[cleanPath]; ok {
+			return u
+		}
+		assetSlug := GenerateAssetSlug(mangaSlug, librarySlug, chapterSlug, cleanPath)
+		u := fmt.Sprintf("/series/%s/%s/%s", mangaSlug, chapterSlug, assetSlug)
+		assetURLs[cleanPath] = u
+		return u
+	}
+
 	// Use regex to find img tags with src attributes
-	imgRe := regexp.MustCompile(`<img[^>]*src=(["']?)([^"'\s>]+)[^>]*>`)
-	html = imgRe.ReplaceAllStringFunc(html, func(match string) string {
+	html = imgSrcRegex.ReplaceAllStringFunc(html, func(match string) string {
 		// Extract the src value - find the position of src=
 		srcIndex := strings.Index(match, `src=`)
 		if srcIndex == -1 {
@@ -709,7 +709,6 @@ func rewriteAssetSources(html, mangaSlug, librarySlug, chapterSlug, chapterPath,
 		}
 
 		// Resolve the asset path relative to the chapter's directory, then relative to OPF dir
-		chapterDir := filepath.Dir(chapterPath)
 		absoluteAsset := filepath.Clean(filepath.Join(chapterDir, originalSrc))
 
 		// Make it relative to the OPF directory
@@ -725,19 +724,17 @@ func rewriteAssetSources(html, mangaSlug, librarySlug, chapterSlug, chapterPath,
 		}
 
 		// Generate encrypted slug URL for this asset
-		assetSlug := GenerateAssetSlug(mangaSlug, librarySlug, chapterSlug, cleanPath)
-		assetURL := fmt.Sprintf("/series/%s/%s/%s", mangaSlug, chapterSlug, assetSlug)
+		newURL := assetURL(cleanPath)
 		log.Debugf("originalSrc=%s, cleanPath=%s\n", originalSrc, cleanPath)
 		// Replace the src attribute
 		oldAttr := `src=` + quoteChar + originalSrc + quoteChar
-		newAttr := `src="` + assetURL + `"`
+		newAttr := `src="` + newURL + `"`
 		log.Debugf("Replacing img src: %s -> %s", oldAttr, newAttr)
 		return strings.Replace(match, oldAttr, newAttr, 1)
 	})
 
 	// Use regex to find link tags with href attributes
-	linkRe := regexp.MustCompile(`<link[^>]*href=(["']?)([^"'\s>]+)[^>]*>`)
-	html = linkRe.ReplaceAllStringFunc(html, func(match string) string {
+	html = linkHrefRegex.ReplaceAllStringFunc(html, func(match string) string {
 		// Extract the href value - find the position of href=
 		hrefIndex := strings.Index(match, `href=`)
 		if hrefIndex == -1 {
@@ -781,7 +778,6 @@ func rewriteAssetSources(html, mangaSlug, librarySlug, chapterSlug, chapterPath,
 		}
 
 		// Resolve the asset path relative to the chapter's directory, then relative to OPF dir
-		chapterDir := filepath.Dir(chapterPath)
 		absoluteAsset := filepath.Clean(filepath.Join(chapterDir, originalHref))
 
 		// Make it relative to the OPF directory
@@ -797,20 +793,18 @@ func rewriteAssetSources(html, mangaSlug, librarySlug, chapterSlug, chapterPath,
 		}
 
 		// Generate encrypted slug URL for this asset
-		assetSlug := GenerateAssetSlug(mangaSlug, librarySlug, chapterSlug, cleanPath)
-		assetURL := fmt.Sprintf("/series/%s/%s/%s", mangaSlug, chapterSlug, assetSlug)
+		newURL := assetURL(cleanPath)
 
 		log.Infof("originalHref=%s, cleanPath=%s\n", originalHref, cleanPath)
 
 		// Replace the href attribute
 		oldAttr := `href=` + quoteChar + originalHref + quoteChar
-		newAttr := `href="` + assetURL + `"`
+		newAttr := `href="` + newURL + `"`
 		return strings.Replace(match, oldAttr, newAttr, 1)
 	})
 
 	// Use regex to find a tags with href attributes
-	aRe := regexp.MustCompile(`<a[^>]*href=(["']?)([^"'\s>]+)[^>]*>`)
-	html = aRe.ReplaceAllStringFunc(html, func(match string) string {
+	html = anchorHrefRegex.ReplaceAllStringFunc(html, func(match string) string {
 		// Extract the href value - find the position of href=
 		hrefIndex := strings.Index(match, `href=`)
 		if hrefIndex == -1 {
@@ -1,12 +1,14 @@
 package files
 
 import (
+	"bufio"
 	"bytes"
 	"crypto/hmac"
 	"crypto/rand"
 	"crypto/sha256"
 	"encoding/base64"
 	"encoding/hex"
+	"errors"
 	"fmt"
 	"image"
 	"image/gif"
@@ -17,7 +19,10 @@ import (
 	"net/http"
 	"os"
 	"path/filepath"
+	"strconv"
 	"strings"
+	"sync"
+	"time"
 
 	"github.com/alexander-bruun/magi/utils/store"
 	"github.com/gofiber/fiber/v3/log"
@@ -181,28 +186,86 @@ func saveOriginal(img image.Image, baseName string, dataBackend *store.FileStore
 	return dataBackend.Save(path, data)
 }
 
-// generateAndSaveThumbnails generates and saves multiple thumbnail sizes
+// generateAndSaveThumbnails generates and saves multiple thumbnail sizes.
 func generateAndSaveThumbnails(img image.Image, baseName string, dataBackend *store.FileStore, useWebp bool, sizes []ThumbnailSize, originalFormat string) error {
-	for _, size := range sizes {
-		resized := resizeAndCrop(img, size.Width, size.Height)
-		var format string
-		if useWebp {
-			format = "webp"
-		} else {
-			format = originalFormat
-		}
-		path := fmt.Sprintf("posters/%s%s.%s", baseName, size.Name, format)
-		data, err := EncodeImageToBytes(resized, format, 100)
+	format := originalFormat
+	if useWebp {
+		format = "webp"
+	}
+
+	thumbnails, err := encodeThumbnails(img, baseName, format, sizes)
+	if err != nil {
+		return err
+	}
+	return SaveEncodedImages(thumbnails, dataBackend)
+}
+
+// EncodedImage is encoded image data together with the store path it belongs at.
+type EncodedImage struct {
+	Path string
+	Data []byte
+}
+
+// encodeThumbnails resizes and encodes each size in its own goroutine since the
+// work is CPU-bound, returning the results in the order of sizes.
+func encodeThumbnails(img image.Image, baseName, format string, sizes []ThumbnailSize) ([]EncodedImage, error) {
+	thumbnails := make([]EncodedImage, len(sizes))
+	errs := make([]error, len(sizes))
+	var wg sync.WaitGroup
+	for i, size := range sizes {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			resized := resizeAndCrop(img, size.Width, size.Height)
+			data, err := EncodeImageToBytes(resized, format, 100)
+			if err != nil {
+				errs[i] = err
+				return
+			}
+			thumbnails[i] = EncodedImage{Path: fmt.Sprintf("posters/%s%s.%s", baseName, size.Name, format), Data: data}
+		}()
+	}
+	wg.Wait()
+
+	for _, err := range errs {
 		if err != nil {
-			return err
+			return nil, err
 		}
-		if err := dataBackend.Save(path, data); err != nil {
+	}
+	return thumbnails, nil
+}
+
+// SaveEncodedImages writes each encoded image to its path in the data backend.
+func SaveEncodedImages(images []EncodedImage, dataBackend *store.FileStore) error {
+	for _, img := range images {
+		if err := dataBackend.Save(img.Path, img.Data); err != nil {
 			return err
 		}
 	}
 	return nil
 }
 
+// saveOriginalAndThumbnails encodes the original alongside the thumbnail sizes.
+// The full-resolution encode is the slowest step, so it runs concurrently with
+// the resized variants instead of ahead of them.
+func saveOriginalAndThumbnails(img image.Image, baseName string, dataBackend *store.FileStore, useWebp bool, sizes []ThumbnailSize, originalFormat string) error {
+	var originalErr error
+	var wg sync.WaitGroup
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		originalErr = saveOriginal(img, baseName, dataBackend, useWebp, originalFormat)
+	}()
+
+	thumbErr := generateAndSaveThumbnails(img, baseName, dataBackend, useWebp, sizes, originalFormat)
+	wg.Wait()
+
+	if originalErr != nil {
+		return originalErr
+	}
+	return thumbErr
+}
+
 // generatePosterURL generates the URL for the poster image
 func generatePosterURL(slug string, useWebp bool) string {
 	format := "jpg"
@@ -224,11 +287,7 @@ func DownloadImageWithThumbnails(fileName, fileUrl string, dataBackend *store.Fi
 		return err
 	}
 
-	if err := saveOriginal(img, baseName, dataBackend, useWebp, format); err != nil {
-		return err
-	}
-
-	return generateAndSaveThumbnails(img, baseName, dataBackend, useWebp, allSizes, format)
+	return saveOriginalAndThumbnails(img, baseName, dataBackend, useWebp, allSizes, format)
 }
 
 // getFileNameWithExtension returns the file name with an extension if not already present.
@@ -240,6 +299,67 @@ func getFileNameWithExtension(fileName, fileUrl string) string {
 	return fileName
 }
 
+// ErrImageUnavailable is returned when the image server answers with a client error
+// that isn't transient (see isPermanentClientError) or with content that isn't a
+// supported image, neither of which will change on retry.
+var ErrImageUnavailable = errors.New("image unavailable")
+
+// isPermanentClientError reports whether status is a 4xx that won't change on
+// retry. 408 Request Timeout, 425 Too Early and 429 Too Many Requests are
+// transient and are retried like 5xx responses.
+func isPermanentClientError(status int) bool {
+	switch status {
+	case http.StatusRequestTimeout, http.StatusTooEarly, http.StatusTooManyRequests:
+		return false
+	}
+	return status >= 400 && status < 500
+}
+
+// RateLimitError is returned when the image server answers 429. RetryAfter holds the
+// server's requested delay from the Retry-After header, or zero if none was given.
+type RateLimitError struct {
+	RetryAfter time.Duration
+}
+
+func (e *RateLimitError) Error() string {
+	return "rate limited by image server"
+}
+
+// parseRetryAfter parses a Retry-After header given either as seconds or as an HTTP date.
+func parseRetryAfter(value string) time.Duration {
+	if value == "" {
+		return 0
+	}
+	if seconds, err := strconv.Atoi(value); err == nil && seconds > 0 {
+		return time.Duration(seconds) * time.Second
+	}
+	if at, err := http.ParseTime(value); err == nil {
+		return max(time.Until(at), 0)
+	}
+	return 0
+}
+
+// imageHTTPClient is shared by all image downloads so connections to the same host are reused.
+// The default transport keeps only two idle connections per host, fewer than the indexer
+// workers and poster pools that fetch covers from the same CDN concurrently.
+var imageHTTPClient = &http.Client{
+	Timeout:   60 * time.Second,
+	Transport: newImageTransport(),
+}
+
+// newImageTransport clones the default transport (keeping proxy and HTTP/2 support)
+// with an idle pool large enough for concurrent cover downloads.
+func newImageTransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConns = 64
+	t.MaxIdleConnsPerHost = 16
+	t.IdleConnTimeout = 90 * time.Second
+	return t
+}
+
+// maxRemoteImagePixels bounds the decoded size of downloaded images; posters are far smaller.
+const maxRemoteImagePixels = 8192 * 8192
+
 // fetchImage downloads and decodes an image from the URL.
 func fetchImage(url string) (image.Image, string, error) {
 	// Create request with proper headers
@@ -251,24 +371,41 @@ func fetchImage(url string) (image.Image, string, error) {
 	// Add user agent to avoid being blocked
 	req.Header.Set("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
 
-	client := &http.Client{}
-	resp, err := client.Do(req)
+	resp, err := imageHTTPClient.Do(req)
 	if err != nil {
 		return nil, "", fmt.Errorf("failed to fetch image: %v", err)
 	}
 	defer resp.Body.Close()
 
+	if resp.StatusCode == http.StatusTooManyRequests {
+		return nil, "", fmt.Errorf("failed to fetch image: HTTP %d: %w", resp.StatusCode, &RateLimitError{RetryAfter: parseRetryAfter(resp.Header.Get("Retry-After"))})
+	}
+	if isPermanentClientError(resp.StatusCode) {
+		return nil, "", fmt.Errorf("failed to fetch image: HTTP %d: %w", resp.StatusCode, ErrImageUnavailable)
+	}
 	if resp.StatusCode != http.StatusOK {
 		return nil, "", fmt.Errorf("failed to fetch image: HTTP %d", resp.StatusCode)
 	}
 
-	// Read the response body into memory first to allow multiple decode attempts
-	data, err := io.ReadAll(resp.Body)
+	// Check the declared dimensions before decoding so a small, highly compressed
+	// file can't force a huge allocation. The header bytes read for the check are
+	// replayed in front of the rest of the body, which is never buffered whole.
+	body := bufio.NewReader(resp.Body)
+	var header bytes.Buffer
+	cfg, _, err := image.DecodeConfig(io.TeeReader(body, &header))
+	if errors.Is(err, image.ErrFormat) {
+		// The server sent something that isn't a supported image, such as an
+		// HTML error page; fetching it again will return the same thing
+		return nil, "", fmt.Errorf("failed to decode image (format detection failed): %w", ErrImageUnavailable)
+	}
 	if err != nil {
-		return nil, "", fmt.Errorf("failed to read image data: %v", err)
+		return nil, "", fmt.Errorf("failed to decode image (format detection failed): %v", err)
+	}
+	if cfg.Width*cfg.Height > maxRemoteImagePixels {
+		return nil, "", fmt.Errorf("image is %dx%d, larger than allowed: %w", cfg.Width, cfg.Height, ErrImageUnavailable)
 	}
 
-	img, format, err := image.Decode(strings.NewReader(string(data)))
+	img, format, err := image.Decode(io.MultiReader(&header, body))
 	if err != nil {
 		return nil, "", fmt.Errorf("failed to decode image (format detection failed): %v", err)
 	}
@@ -600,13 +737,8 @@ func ExtractPosterImage(filePath, slug string, dataBackend *store.FileStore, use
 		return "", fmt.Errorf("unsupported file type for poster extraction: %s", filePath)
 	}
 
-	// Save original (unprocessed) for potential future use
-	if err := saveOriginal(img, slug, dataBackend, useWebp, "jpeg"); err != nil {
-		return "", err
-	}
-
-	// Generate thumbnails
-	if err := generateAndSaveThumbnails(img, slug, dataBackend, useWebp, standardSizes, "jpeg"); err != nil {
+	// Save the original (unprocessed) image and generate thumbnails
+	if err := saveOriginalAndThumbnails(img, slug, dataBackend, useWebp, standardSizes, "jpeg"); err != nil {
 		return "", err
 	}
 
@@ -625,13 +757,8 @@ func ProcessLocalImageWithThumbnails(imagePath, slug string, dataBackend *store.
 		return "", fmt.Errorf("failed to open image: %w", err)
 	}
 
-	// Save original (unprocessed) for potential future use
-	if err := saveOriginal(img, slug, dataBackend, useWebp, "jpeg"); err != nil {
-		return "", err
-	}
-
-	// Generate thumbnails
-	if err := generateAndSaveThumbnails(img, slug, dataBackend, useWebp, standardSizes, "jpeg"); err != nil {
+	// Save the original (unprocessed) image and generate thumbnails
+	if err := saveOriginalAndThumbnails(img, slug, dataBackend, useWebp, standardSizes, "jpeg"); err != nil {
 		return "", err
 	}
 
@@ -649,13 +776,8 @@ func DownloadPosterImage(imageURL, slug string, dataBackend *store.FileStore, us
 		return "", fmt.Errorf("failed to download image from %s: %w", imageURL, err)
 	}
 
-	// Save original (unprocessed) for potential future use
-	if err := saveOriginal(img, slug, dataBackend, useWebp, format); err != nil {
-		return "", err
-	}
-
-	// Generate thumbnails
-	if err := generateAndSaveThumbnails(img, slug, dataBackend, useWebp, standardSizes, format); err != nil {
+	// Save the original (unprocessed) image and generate thumbnails
+	if err := saveOriginalAndThumbnails(img, slug, dataBackend, useWebp, standardSizes, format); err != nil {
 		return "", err
 	}
 
@@ -677,15 +799,15 @@ func GenerateThumbnails(fullImagePath, slug string, dataBackend *store.FileStore
 		return fmt.Errorf("failed to decode image: %w", err)
 	}
 
-	// Determine format from the full image path extension
-	ext := strings.ToLower(filepath.Ext(fullImagePath))
-	format := "jpeg"
-	useWebp := false
-	if ext == ".webp" {
-		format = "webp"
-		useWebp = true
-	}
+	useWebp := strings.ToLower(filepath.Ext(fullImagePath)) == ".webp"
+	return generateAndSaveThumbnails(img, slug, dataBackend, useWebp, posterThumbnailSizes, "jpeg")
+}
+
+// posterThumbnailSizes are the derived sizes written next to an existing full-size poster.
+var posterThumbnailSizes = []ThumbnailSize{{"_thumb", thumbWidth, thumbHeight}, {"_small", smallWidth, smallHeight}, {"_tiny", tinyWidth, tinyHeight}, {"_display", displayWidth, displayHeight}}
 
-	sizes := []ThumbnailSize{{"_thumb", thumbWidth, thumbHeight}, {"_small", smallWidth, smallHeight}, {"_tiny", tinyWidth, tinyHeight}, {"_display", displayWidth, displayHeight}}
-	return generateAndSaveThumbnails(img, slug, dataBackend, useWebp, sizes, format)
+// EncodePosterThumbnails encodes the poster thumbnail sizes for an already decoded
+// image as WebP without saving them, so callers can store them alongside the poster.
+func EncodePosterThumbnails(img image.Image, slug string) ([]EncodedImage, error) {
+	return encodeThumbnails(img, slug, "webp", posterThumbnailSizes)
 }
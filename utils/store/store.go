@@ -4,11 +4,19 @@ import (
 	"io"
 	"os"
 	"path/filepath"
+	"strings"
+	"sync"
 )
 
+// tempFilePrefix marks in-progress writes so List can skip them.
+const tempFilePrefix = ".magi-tmp-"
+
 // FileStore provides local file system storage operations.
 type FileStore struct {
 	basePath string
+	// createdDirs remembers directories already ensured by Save/SaveReader so
+	// repeated writes into the same folder skip the MkdirAll stat calls.
+	createdDirs sync.Map
 }
 
 // NewFileStore creates a new local file store rooted at basePath.
@@ -20,35 +28,74 @@ func NewFileStore(basePath string) *FileStore {
 
 // Save saves data to the specified path
 func (l *FileStore) Save(path string, data []byte) error {
-	fullPath := filepath.Join(l.basePath, path)
-
-	// Ensure directory exists
-	dir := filepath.Dir(fullPath)
-	if err := os.MkdirAll(dir, 0755); err != nil {
+	return l.writeAtomic(filepath.Join(l.basePath, path), func(w io.Writer) error {
+		_, err := w.Write(data)
 		return err
-	}
-
-	return os.WriteFile(fullPath, data, 0644)
+	})
 }
 
 // SaveReader saves data from a reader to the specified path
 func (l *FileStore) SaveReader(path string, reader io.Reader) error {
-	fullPath := filepath.Join(l.basePath, path)
+	return l.writeAtomic(filepath.Join(l.basePath, path), func(w io.Writer) error {
+		_, err := io.Copy(w, reader)
+		return err
+	})
+}
 
+// writeAtomic writes to a temporary file next to fullPath and renames it into
+// place, so files being served are never observed half-written.
+func (l *FileStore) writeAtomic(fullPath string, write func(io.Writer) error) error {
 	// Ensure directory exists
 	dir := filepath.Dir(fullPath)
-	if err := os.MkdirAll(dir, 0755); err != nil {
+	if err := l.ensureDir(dir); err != nil {
 		return err
 	}
 
-	file, err := os.Create(fullPath)
+	tmp, err := os.CreateTemp(dir, tempFilePrefix+"*")
+	if os.IsNotExist(err) {
+		// The directory was removed behind our back; recreate it and retry once
+		l.createdDirs.Delete(dir)
+		if err := l.ensureDir(dir); err != nil {
+			return err
+		}
+		tmp, err = os.CreateTemp(dir, tempFilePrefix+"*")
+	}
 	if err != nil {
 		return err
 	}
-	defer file.Close()
 
-	_, err = io.Copy(file, reader)
-	return err
+	tmpPath := tmp.Name()
+	if err := write(tmp); err != nil {
+		tmp.Close()
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := tmp.Chmod(0644); err != nil {
+		tmp.Close()
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := tmp.Close(); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := os.Rename(tmpPath, fullPath); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	return nil
+}
+
+// ensureDir creates dir if this store hasn't already done so.
+func (l *FileStore) ensureDir(dir string) error {
+	if _, ok := l.createdDirs.Load(dir); ok {
+		return nil
+	}
+	if err := os.MkdirAll(dir, 0755); err != nil {
+		return err
+	}
+	l.createdDirs.Store(dir, struct{}{})
+	return nil
 }
 
 // Load loads data from the specified path
@@ -98,7 +145,7 @@ func (l *FileStore) List(path string) ([]string, error) {
 
 	var files []string
 	for _, entry := range entries {
-		if !entry.IsDir() {
+		if !entry.IsDir() && !strings.HasPrefix(entry.Name(), tempFilePrefix) {
 			files = append(files, entry.Name())
 		}
 	}
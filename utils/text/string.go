@@ -17,13 +17,17 @@ import (
 	"github.com/yuin/goldmark/renderer/html"
 )
 
-// Pre-compiled regexes for performance
-var complexPatterns = []*regexp.Regexp{
-	regexp.MustCompile(`[vc]\d+\s*-\s*[vc]?\d+`),         // Removing patterns like 'v1 - v2', 'c1 - c2', 'v1 - 2', 'c1 - 2'
-	regexp.MustCompile(`\b\d+-\d+\b`),                    // Removing patterns like '12-34', '000-305', '1-9', '123-456'
-	regexp.MustCompile(`Vol\.\s*\d+\s*\+\s*Vol\.\s*\d+`), // Removing patterns like 'Vol. 1 + Vol. 2'
-	regexp.MustCompile(`\sS\d+\b`),                       // Removing patterns like ' S1' or ' S12'
-	regexp.MustCompile(`\bVolumes?\d+-\d+\+\w+\b`),       // Removing patterns like 'Volume1-2+ABC'
+// Pre-compiled regexes for performance. Each pattern is paired with a literal it
+// cannot match without, so the regex only runs on names that contain it.
+var complexPatterns = []struct {
+	literal string
+	re      *regexp.Regexp
+}{
+	{"-", regexp.MustCompile(`[vc]\d+\s*-\s*[vc]?\d+`)},            // Removing patterns like 'v1 - v2', 'c1 - c2', 'v1 - 2', 'c1 - 2'
+	{"-", regexp.MustCompile(`\b\d+-\d+\b`)},                       // Removing patterns like '12-34', '000-305', '1-9', '123-456'
+	{"Vol.", regexp.MustCompile(`Vol\.\s*\d+\s*\+\s*Vol\.\s*\d+`)}, // Removing patterns like 'Vol. 1 + Vol. 2'
+	{"S", regexp.MustCompile(`\sS\d+\b`)},                          // Removing patterns like ' S1' or ' S12'
+	{"Volume", regexp.MustCompile(`\bVolumes?\d+-\d+\+\w+\b`)},     // Removing patterns like 'Volume1-2+ABC'
 }
 
 // RemovePatterns applies custom parsing to clean up the path string.
@@ -79,9 +83,11 @@ func removeContentBetween(path, open, close string) string {
 	return path
 }
 
+// trailingSuffixes are release tags stripped from the end of series names.
+var trailingSuffixes = []string{" - archived", " RAR", " ZIP", " rar", " zip", " +Plus"}
+
 func removeTrailingSuffixes(path string) string {
-	suffixes := []string{" - archived", " RAR", " ZIP", " rar", " zip", " +Plus"}
-	for _, suffix := range suffixes {
+	for _, suffix := range trailingSuffixes {
 		path = strings.TrimSuffix(path, suffix)
 	}
 	return path
@@ -95,8 +101,14 @@ func handleSpecialCases(path string) string {
 }
 
 func processComplexPatterns(path string) string {
-	for _, re := range complexPatterns {
-		path = re.ReplaceAllString(path, "")
+	// Every pattern needs a digit; most series names have none
+	if !strings.ContainsAny(path, "0123456789") {
+		return strings.TrimSpace(path)
+	}
+	for _, p := range complexPatterns {
+		if strings.Contains(path, p.literal) {
+			path = p.re.ReplaceAllString(path, "")
+		}
 	}
 	return strings.TrimSpace(path)
 }
@@ -244,61 +256,97 @@ func SimilarityRatio(s1, s2 string) float64 {
 	return 1.0 - float64(distance)/float64(maxLen)
 }
 
+// Pre-compiled regexes for ExtractChapterName
+var (
+	volumeNameRegex  = regexp.MustCompile(`(?i)(?:v(?:ol(?:ume)?)?)\.?\s*(\d+)`)
+	chapterNameRegex = regexp.MustCompile(`(?i)(?:chapter|c(?:h(?:apter)?)?)\.?\s*(\d+)`)
+)
+
 // ExtractChapterName attempts to extract a volume or chapter name from a filename.
 // If no volume/chapter pattern is found, returns the cleaned filename.
 func ExtractChapterName(filename string) string {
+	if name, ok := extractVolumeOrChapter(filename); ok {
+		return name
+	}
+	return chapterNameFromCleaned(RemovePatterns(strings.TrimSuffix(filename, filepath.Ext(filename))))
+}
+
+// ExtractChapterNameCleaned is ExtractChapterName for callers that already hold
+// RemovePatterns of the filename without its extension, skipping the second cleanup.
+func ExtractChapterNameCleaned(filename, cleaned string) string {
+	if name, ok := extractVolumeOrChapter(filename); ok {
+		return name
+	}
+	return chapterNameFromCleaned(cleaned)
+}
+
+// extractVolumeOrChapter returns a "Volume N" or "Chapter N" name if the filename has such a pattern.
+func extractVolumeOrChapter(filename string) (string, bool) {
 	// Look for volume patterns (v01, vol.1, volume 1, etc.)
-	if vol := regexp.MustCompile(`(?i)(?:v(?:ol(?:ume)?)?)\.?\s*(\d+)`).FindStringSubmatch(filename); vol != nil {
-		numStr := strings.TrimLeft(vol[1], "0")
-		if numStr == "" {
-			numStr = "0"
-		}
-		return fmt.Sprintf("Volume %s", numStr)
+	if vol := volumeNameRegex.FindStringSubmatch(filename); vol != nil {
+		return "Volume " + trimLeadingZeros(vol[1]), true
 	}
 	// Look for chapter patterns (chapter 01, c01, ch.1, etc.)
-	if ch := regexp.MustCompile(`(?i)(?:chapter|c(?:h(?:apter)?)?)\.?\s*(\d+)`).FindStringSubmatch(filename); ch != nil {
-		numStr := strings.TrimLeft(ch[1], "0")
-		if numStr == "" {
-			numStr = "0"
-		}
-		return fmt.Sprintf("Chapter %s", numStr)
+	if ch := chapterNameRegex.FindStringSubmatch(filename); ch != nil {
+		return "Chapter " + trimLeadingZeros(ch[1]), true
 	}
-	// Otherwise, return the cleaned filename
-	cleaned := RemovePatterns(strings.TrimSuffix(filename, filepath.Ext(filename)))
+	return "", false
+}
+
+// chapterNameFromCleaned names a chapter from its cleaned filename.
+func chapterNameFromCleaned(cleaned string) string {
 	// If the cleaned name is just digits, assume it's a chapter number
-	if regexp.MustCompile(`^\d+$`).MatchString(cleaned) {
-		numStr := strings.TrimLeft(cleaned, "0")
-		if numStr == "" {
-			numStr = "0"
-		}
-		return fmt.Sprintf("Chapter %s", numStr)
+	if IsDigits(cleaned) {
+		return "Chapter " + trimLeadingZeros(cleaned)
 	}
 	return cleaned
 }
 
+// IsDigits reports whether s is non-empty and made up only of ASCII digits.
+func IsDigits(s string) bool {
+	if s == "" {
+		return false
+	}
+	for i := 0; i < len(s); i++ {
+		if s[i] < '0' || s[i] > '9' {
+			return false
+		}
+	}
+	return true
+}
+
+// trimLeadingZeros strips leading zeros from a digit string, keeping a single "0" for all-zero input.
+func trimLeadingZeros(digits string) string {
+	if trimmed := strings.TrimLeft(digits, "0"); trimmed != "" {
+		return trimmed
+	}
+	return "0"
+}
+
+// markdownRenderer is built once and shared; goldmark.Markdown is safe for concurrent use.
+var markdownRenderer = goldmark.New(
+	goldmark.WithExtensions(
+		extension.GFM,     // GitHub Flavored Markdown
+		extension.Linkify, // Auto-link URLs
+	),
+	goldmark.WithParserOptions(
+		parser.WithAutoHeadingID(), // Add IDs to headings
+	),
+	goldmark.WithRendererOptions(
+		html.WithHardWraps(), // Convert newlines to <br>
+		html.WithXHTML(),     // Use XHTML-style tags
+		html.WithUnsafe(),    // Allow raw HTML (be careful with user input!)
+	),
+)
+
 // MarkdownToHTML converts markdown text to safe HTML using goldmark
 func MarkdownToHTML(markdown string) template.HTML {
 	if markdown == "" {
 		return template.HTML("")
 	}
 
-	md := goldmark.New(
-		goldmark.WithExtensions(
-			extension.GFM,     // GitHub Flavored Markdown
-			extension.Linkify, // Auto-link URLs
-		),
-		goldmark.WithParserOptions(
-			parser.WithAutoHeadingID(), // Add IDs to headings
-		),
-		goldmark.WithRendererOptions(
-			html.WithHardWraps(), // Convert newlines to <br>
-			html.WithXHTML(),     // Use XHTML-style tags
-			html.WithUnsafe(),    // Allow raw HTML (be careful with user input!)
-		),
-	)
-
 	var buf bytes.Buffer
-	if err := md.Convert([]byte(markdown), &buf); err != nil {
+	if err := markdownRenderer.Convert([]byte(markdown), &buf); err != nil {
 		log.Errorf("Failed to convert markdown to HTML: %v", err)
 		// Return plain text wrapped in <p> tag as fallback
 		return template.HTML("<p>" + template.HTMLEscapeString(markdown) + "</p>")